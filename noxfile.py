@@ -52,8 +52,10 @@ def security(session):
 
 @nox.session(python="3.11")
 def tests(session):
-    """Run all tests with pytest."""
-    session.install("pytest", "pytest-asyncio", "pytest-cov", "pytest-mock", "hypothesis")
+    """Run all tests with pytest (pass ``-- -n auto`` to parallelize with xdist)."""
+    session.install(
+        "pytest", "pytest-asyncio", "pytest-cov", "pytest-mock", "pytest-xdist", "hypothesis"
+    )
     session.install("-e", ".")
     session.run("pytest", "tests/", "--asyncio-mode=strict", "-v", *session.posargs)
 
@@ -1,22 +1,41 @@
 """Task discovery and management."""
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from ..core.types import Project, Task, TaskInstruction, TaskStatus, TaskType
 from ..utils.filesystem import list_projects
 from ..utils.yaml_utils import load_yaml
 
 
-def determine_task_type(task_path: Path) -> TaskType:
-    """Determine task type based on files present."""
+def _glob_files(path: Path, pattern: str) -> List[Path]:
+    """Return files in path matching pattern."""
+    return list(path.glob(pattern))
+
+
+def _path_exists(path: Path) -> bool:
+    """Return whether path exists."""
+    return path.exists()
+
+
+def determine_task_type(
+    task_path: Path,
+    *,
+    scanner: Callable[[Path, str], List[Path]] = _glob_files,
+    exists: Callable[[Path], bool] = _path_exists,
+) -> TaskType:
+    """Determine task type based on files present.
+
+    The filesystem probes can be replaced via ``scanner`` and ``exists``,
+    which lets callers (and tests) avoid touching the real filesystem.
+    """
     # Check for machine task files
     for pattern in ["*.sh", "*.py"]:
-        if list(task_path.glob(pattern)):
+        if scanner(task_path, pattern):
             return TaskType.MACHINE
 
     # Check for AI task file
-    if (task_path / "prompt.yaml").exists():
+    if exists(task_path / "prompt.yaml"):
         return TaskType.AI
 
     # Default to human task
@@ -1,9 +1,10 @@
 """Optimized task discovery with performance enhancements."""
 
 import logging
+import os
 import time
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Callable, Any
+from typing import AbstractSet, Dict, FrozenSet, List, Mapping, Set, Tuple, Optional, Callable, Any
 from functools import lru_cache
 
 from .types import Task
@@ -12,117 +13,110 @@ from ..utils.filesystem import find_instruction_files
 logger = logging.getLogger(__name__)
 
 
-class TaskCache:
-    """Cache for task discovery results."""
+Fingerprint = Tuple[int, int]
+DependencyGraph = Mapping[str, AbstractSet[str]]
 
-    def __init__(self) -> None:
-        self._task_cache: Dict[str, Task] = {}
-        self._dependency_cache: Dict[str, Set[str]] = {}
-        self._last_modified: Dict[str, float] = {}
 
-    def get_task(self, task_path: Path) -> Optional[Task]:
-        """Get cached task if still valid."""
-        path_str = str(task_path)
+def _file_fingerprint(path: Path) -> Optional[Fingerprint]:
+    """Return (mtime_ns, size) from a single stat call, or None if missing."""
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size)
 
-        if path_str not in self._task_cache:
-            return None
 
-        # Check if instruction file was modified
-        instruction_file = task_path / "instruction.yaml"
-        if not instruction_file.exists():
-            return None
+@lru_cache(maxsize=4096)
+def _load_task(task_path: Path, fingerprint: Fingerprint) -> Optional[Task]:
+    """Load a task; memoized per instruction.yaml fingerprint.
 
-        current_mtime = instruction_file.stat().st_mtime
-        if current_mtime != self._last_modified.get(path_str, 0):
-            # Invalidate cache
-            self._task_cache.pop(path_str, None)
-            self._dependency_cache.pop(path_str, None)
+    The fingerprint is part of the key, so editing instruction.yaml produces a
+    cache miss and the stale entry simply ages out of the LRU. The Path itself
+    is the key, so no str() copy is made per lookup.
+    """
+    from .discovery import discover_task
+
+    return discover_task(task_path.parent.name, task_path)
+
+
+class TaskCache:
+    """Cache for task discovery results, backed by ``_load_task``'s lru_cache."""
+
+    def get_task(self, task_path: Path) -> Optional[Task]:
+        """Return the task, reusing the cached load while instruction.yaml is unchanged."""
+        fingerprint = _file_fingerprint(task_path / "instruction.yaml")
+        if fingerprint is None:
             return None
 
-        return self._task_cache[path_str]
+        return _load_task(task_path, fingerprint)
 
-    def cache_task(self, task: Task) -> None:
-        """Cache task with modification time."""
-        path_str = str(task.path)
-        self._task_cache[path_str] = task
+    def cache_info(self) -> Any:
+        """Return hit/miss statistics of the underlying lru_cache."""
+        return _load_task.cache_info()
 
-        instruction_file = task.path / "instruction.yaml"
-        if instruction_file.exists():
-            self._last_modified[path_str] = instruction_file.stat().st_mtime
+    def cache_clear(self) -> None:
+        """Drop all cached tasks."""
+        _load_task.cache_clear()
 
 
 # Global cache instance
 _task_cache = TaskCache()
 
 
-@lru_cache(maxsize=128)
-def _cached_find_instruction_files(workspace_path: str) -> Tuple[str, ...]:
-    """Cached version of find_instruction_files."""
-    return tuple(str(p) for p in find_instruction_files(Path(workspace_path)))
-
-
 def discover_tasks_optimized(workspace_path: Path) -> List[Task]:
     """Discover tasks with performance optimizations."""
     logger.debug(f"Discovering tasks in: {workspace_path}")
     start_time = time.time()
 
     tasks = []
-    instruction_files = _cached_find_instruction_files(str(workspace_path))
 
-    # Batch process instruction files
-    for instruction_file_str in instruction_files:
-        instruction_file = Path(instruction_file_str)
+    # Walked on every call: no cheap stat of the workspace covers a task added
+    # deeper in projects/, so a cached listing would hide new tasks
+    for instruction_file in find_instruction_files(workspace_path):
         task_path = instruction_file.parent
 
-        # Check cache first
-        cached_task = _task_cache.get_task(task_path)
-        if cached_task:
-            tasks.append(cached_task)
-            continue
-
         try:
-            # Load task (this could be further optimized with bulk YAML loading)
-            from .discovery import discover_task
-
-            project_name = task_path.parent.name
-            task = discover_task(project_name, task_path)
-
-            if task:
-                tasks.append(task)
-                _task_cache.cache_task(task)
-
+            # Cached per instruction.yaml fingerprint; loads on a miss
+            task = _task_cache.get_task(task_path)
         except Exception as e:
             logger.warning(f"Failed to load task from {task_path}: {e}")
             continue
 
+        if task:
+            tasks.append(task)
+
     elapsed = time.time() - start_time
     logger.debug(f"Discovered {len(tasks)} tasks in {elapsed:.3f}s")
 
     return tasks
 
 
-def build_dependency_graph_optimized(tasks: List[Task]) -> Dict[str, Set[str]]:
-    """Build dependency graph with optimizations."""
+def build_dependency_graph_optimized(tasks: List[Task]) -> Dict[str, FrozenSet[str]]:
+    """Build dependency graph with optimizations.
+
+    Adjacency values are frozensets: the graph is read-only once built and
+    frozensets are hashable and more compact than mutable sets.
+    """
     logger.debug("Building optimized dependency graph")
     start_time = time.time()
 
-    # Create task lookup for O(1) access
-    task_lookup = {task.full_name: task for task in tasks}
+    # Index task names once for O(1) dependency validation
+    by_name = {task.full_name: task for task in tasks}
 
     # Build adjacency list representation
     graph = {}
 
     for task in tasks:
-        task_deps = set()
+        full_name = task.full_name
+        valid_deps = []
 
-        # Process dependencies efficiently
         for dep in task.instruction.dependencies:
-            if dep in task_lookup:
-                task_deps.add(dep)
+            if dep in by_name:
+                valid_deps.append(dep)
             else:
-                logger.warning(f"Task {task.full_name} depends on non-existent task: {dep}")
+                logger.warning(f"Task {full_name} depends on non-existent task: {dep}")
 
-        graph[task.full_name] = task_deps
+        graph[full_name] = frozenset(valid_deps)
 
     elapsed = time.time() - start_time
     logger.debug(f"Built dependency graph in {elapsed:.3f}s")
@@ -130,9 +124,12 @@ def build_dependency_graph_optimized(tasks: List[Task]) -> Dict[str, Set[str]]:
     return graph
 
 
-def find_ready_tasks_optimized(
-    tasks: List[Task], dependency_graph: Dict[str, Set[str]]
-) -> List[Task]:
+def _completed_task_names(tasks: List[Task]) -> Set[str]:
+    """Return full names of tasks whose directory contains done.md."""
+    return {task.full_name for task in tasks if os.path.exists(os.path.join(task.path, "done.md"))}
+
+
+def find_ready_tasks_optimized(tasks: List[Task], dependency_graph: DependencyGraph) -> List[Task]:
     """Find ready tasks using optimized algorithms."""
     if not tasks:
         return []
@@ -140,20 +137,19 @@ def find_ready_tasks_optimized(
     logger.debug("Finding ready tasks with optimization")
     start_time = time.time()
 
-    # Create lookup sets for O(1) membership testing
-    completed_tasks = {task.full_name for task in tasks if (task.path / "done.md").exists()}
+    # One done.md probe per task; everything below is set arithmetic
+    completed_tasks = _completed_task_names(tasks)
 
     ready_tasks = []
 
     for task in tasks:
-        # Skip if already completed
-        if task.full_name in completed_tasks:
+        full_name = task.full_name
+        if full_name in completed_tasks:
             continue
 
-        # Check if all dependencies are satisfied
-        task_deps = dependency_graph.get(task.full_name, set())
-
-        if task_deps.issubset(completed_tasks):
+        # Kahn-style: a task is ready once none of its dependencies is unmet
+        unmet = dependency_graph.get(full_name, frozenset()) - completed_tasks
+        if not unmet:
             ready_tasks.append(task)
 
     elapsed = time.time() - start_time
@@ -162,44 +158,65 @@ def find_ready_tasks_optimized(
     return ready_tasks
 
 
-def detect_cycles_optimized(dependency_graph: Dict[str, Set[str]]) -> List[List[str]]:
-    """Detect cycles using optimized DFS with early termination."""
+def detect_cycles_optimized(dependency_graph: DependencyGraph) -> List[List[str]]:
+    """Detect cycles as strongly connected components (iterative Tarjan).
+
+    Every SCC with more than one task is reported once, as is any task that
+    depends on itself. Runs in O(V + E) with an explicit stack, so deep
+    dependency chains cannot hit Python's recursion limit.
+    """
     logger.debug("Detecting cycles with optimization")
     start_time = time.time()
 
-    WHITE, GRAY, BLACK = 0, 1, 2
-    colors = {node: WHITE for node in dependency_graph}
-    cycles = []
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    scc_stack: List[str] = []
+    cycles: List[List[str]] = []
+    counter = 0
 
-    def dfs(node: str, path: List[str]) -> None:
-        if colors[node] == GRAY:
-            # Found cycle
-            cycle_start = path.index(node)
-            cycle = path[cycle_start:] + [node]
-            cycles.append(cycle)
-            return
-
-        if colors[node] == BLACK:
-            return
-
-        colors[node] = GRAY
-        path.append(node)
-
-        for neighbor in dependency_graph.get(node, []):
-            if neighbor in dependency_graph:  # Only visit existing nodes
-                dfs(neighbor, path)
-
-        path.pop()
-        colors[node] = BLACK
-
-    # Process nodes in topological order hint for better performance
-    for node in sorted(dependency_graph.keys()):
-        if colors[node] == WHITE:
-            dfs(node, [])
+    for root in sorted(dependency_graph):
+        if root in index:
+            continue
 
-        # Early termination if cycles found and we only need to detect existence
-        if cycles and len(cycles) >= 10:  # Limit cycle detection for performance
-            break
+        index[root] = lowlink[root] = counter
+        counter += 1
+        scc_stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(dependency_graph[root]))]
+
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in dependency_graph:  # Only visit existing nodes
+                    continue
+                if neighbor not in index:
+                    index[neighbor] = lowlink[neighbor] = counter
+                    counter += 1
+                    scc_stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(dependency_graph[neighbor])))
+                    break
+                if neighbor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[neighbor])
+            else:
+                # All neighbors done: close the node and propagate to its parent
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in dependency_graph[node]:
+                        component.reverse()
+                        cycles.append(component)
 
     elapsed = time.time() - start_time
     logger.debug(f"Cycle detection completed in {elapsed:.3f}s")
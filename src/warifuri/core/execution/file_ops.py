@@ -2,9 +2,11 @@
 
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
+from ...utils.filesystem import MAX_COPY_WORKERS
 from .validation import _resolve_input_path_safely
 
 if TYPE_CHECKING:
@@ -12,6 +14,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+CopyJob = Tuple[Path, Path, str]
+
+_CROSS_PROJECT_PREFIX = "../"
+
 
 def copy_input_files(
     task: "Task", temp_dir: Path, execution_log: List[str], workspace_path: Optional[Path] = None
@@ -21,37 +27,98 @@ def copy_input_files(
         execution_log.append("No input files to copy")
         return
 
+    # Derive the task-invariant paths once; the loop below only joins onto them
+    task_path = task.path
     if workspace_path is None:
-        workspace_path = task.path.parent.parent.parent
+        workspace_path = task_path.parent.parent.parent
     projects_base = workspace_path / "projects"
 
     execution_log.append("Copying input files to temporary directory...")
 
+    jobs: List[CopyJob] = []
+    # temp_dir exists already, so top-level inputs never need a mkdir
+    created_dirs: Set[Path] = {temp_dir}
     for input_file in task.instruction.inputs:
-        source_path, log_message = _resolve_input_path_safely(input_file, task.path, projects_base)
-        execution_log.append(log_message)
-
-        if source_path is None:
-            continue
-
-        if not source_path.exists():
-            execution_log.append(f"ERROR: Input file not found during copy: {source_path}")
-            continue
-
-        # Create destination path in temp directory
-        if input_file.startswith("../"):
-            # For cross-project files, flatten the path structure
-            dest_filename = input_file.replace("../", "").replace("/", "_")
-            dest_path = temp_dir / dest_filename
-        else:
-            # Preserve relative structure for local files
-            dest_path = temp_dir / input_file
+        job = _resolve_and_prepare_one(
+            input_file, task_path, projects_base, temp_dir, created_dirs, execution_log
+        )
+        if job is not None:
+            jobs.append(job)
+
+    _copy_inputs(jobs, execution_log)
+
+
+def _resolve_and_prepare_one(
+    input_file: str,
+    task_path: Path,
+    projects_base: Path,
+    temp_dir: Path,
+    created_dirs: Set[Path],
+    execution_log: List[str],
+) -> Optional[CopyJob]:
+    """Resolve one input and create its destination directory; None if it is skipped."""
+    source_path, log_message = _resolve_input_path_safely(input_file, task_path, projects_base)
+    execution_log.append(log_message)
+
+    if source_path is None:
+        return None
+
+    if not source_path.exists():
+        execution_log.append(f"ERROR: Input file not found during copy: {source_path}")
+        return None
+
+    # Create destination path in temp directory
+    if input_file.startswith(_CROSS_PROJECT_PREFIX):
+        # For cross-project files, flatten the path structure
+        dest_path = temp_dir / _flatten_cross_project_input(input_file)
+    else:
+        # Preserve relative structure for local files
+        dest_path = temp_dir / input_file
+
+    # Ensure destination directory exists; inputs often share a parent
+    dest_dir = dest_path.parent
+    if dest_dir not in created_dirs:
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        created_dirs.add(dest_dir)
+
+    return source_path, dest_path, input_file
+
+
+def _flatten_cross_project_input(input_file: str) -> str:
+    """Flatten ``../proj/task/file`` into ``proj_task_file``."""
+    return input_file.replace(_CROSS_PROJECT_PREFIX, "").replace("/", "_")
+
+
+def _has_overlapping_destinations(jobs: List[CopyJob]) -> bool:
+    """True if two jobs write the same destination or one lies inside another's."""
+    destinations: Set[Path] = set()
+    for _source_path, dest_path, _input_file in jobs:
+        if dest_path in destinations:
+            return True
+        destinations.add(dest_path)
+    return any(parent in destinations for dest_path in destinations for parent in dest_path.parents)
+
+
+def _copy_inputs(jobs: List[CopyJob], execution_log: List[str]) -> None:
+    """Copy resolved inputs, overlapping the blocking copies when there are several.
+
+    Each job logs into its own buffer; buffers are appended in input order so
+    the execution log stays deterministic regardless of completion order.
+    Inputs whose destinations collide or nest are copied serially, so the
+    last input still wins as it did before copies were overlapped.
+    """
+    if len(jobs) <= 1 or _has_overlapping_destinations(jobs):
+        for source_path, dest_path, input_file in jobs:
+            _copy_file_or_directory(source_path, dest_path, input_file, execution_log)
+        return
 
-        # Ensure destination directory exists
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
+    job_logs: List[List[str]] = [[] for _ in jobs]
+    with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, len(jobs))) as pool:
+        for (source_path, dest_path, input_file), job_log in zip(jobs, job_logs, strict=True):
+            pool.submit(_copy_file_or_directory, source_path, dest_path, input_file, job_log)
 
-        # Copy file or directory
-        _copy_file_or_directory(source_path, dest_path, input_file, execution_log)
+    for job_log in job_logs:
+        execution_log.extend(job_log)
 
 
 def _copy_file_or_directory(
@@ -60,6 +127,9 @@ def _copy_file_or_directory(
     """Copy a single file or directory."""
     try:
         if source_path.is_file():
+            # copy2 already takes the kernel zero-copy path (sendfile on Linux,
+            # fcopyfile on macOS); a hand-rolled sendfile loop would only
+            # duplicate it and its fallbacks
             shutil.copy2(source_path, dest_path)
             execution_log.append(f"Copied input file: {input_file} -> {dest_path}")
         else:
@@ -19,13 +19,23 @@ def execute_human_task(task: "Task", dry_run: bool = False) -> bool:
     Returns:
         True (human tasks are always considered successful as they require manual completion)
     """
-    logger.info(f"Human task: {task.full_name}")
-
+    full_name = task.full_name
     if dry_run:
-        logger.info(f"[DRY RUN] Human task requires manual intervention: {task.full_name}")
+        logger.info(
+            "Human task: %s\n[DRY RUN] Human task requires manual intervention: %s",
+            full_name,
+            full_name,
+        )
     else:
-        logger.info(f"Human task '{task.full_name}' requires manual intervention.")
-        logger.info(f"Description: {task.instruction.description}")
-        logger.info("Please complete the task manually and run 'warifuri mark-done' when finished.")
+        # One record instead of four keeps handler dispatch off the hot path
+        logger.info(
+            "Human task: %s\n"
+            "Human task '%s' requires manual intervention.\n"
+            "Description: %s\n"
+            "Please complete the task manually and run 'warifuri mark-done' when finished.",
+            full_name,
+            full_name,
+            task.instruction.description,
+        )
 
     return True
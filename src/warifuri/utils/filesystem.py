@@ -1,7 +1,9 @@
 """File system utilities."""
 
+import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterator, List, Optional, Union
 
@@ -24,30 +26,27 @@ def find_workspace_root(start_path: Optional[Union[str, Path]] = None) -> Option
     return None
 
 
-def list_projects(workspace_path: Path) -> List[str]:
-    """List all project names in workspace."""
-    projects_dir = workspace_path / "projects"
-    if not projects_dir.exists():
+def _list_subdirectories(directory: Path) -> List[str]:
+    """Names of non-hidden subdirectories, or [] if directory does not exist.
+
+    os.scandir answers is_dir() from the d_type recorded in the directory
+    listing, so only symlinked entries cost an extra stat.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [entry.name for entry in it if entry.is_dir() and not entry.name.startswith(".")]
+    except FileNotFoundError:
         return []
 
-    return [
-        item.name
-        for item in projects_dir.iterdir()
-        if item.is_dir() and not item.name.startswith(".")
-    ]
+
+def list_projects(workspace_path: Path) -> List[str]:
+    """List all project names in workspace."""
+    return _list_subdirectories(workspace_path / "projects")
 
 
 def list_tasks(workspace_path: Path, project_name: str) -> List[str]:
     """List all task names in a project."""
-    project_dir = workspace_path / "projects" / project_name
-    if not project_dir.exists():
-        return []
-
-    return [
-        item.name
-        for item in project_dir.iterdir()
-        if item.is_dir() and not item.name.startswith(".")
-    ]
+    return _list_subdirectories(workspace_path / "projects" / project_name)
 
 
 def find_instruction_files(workspace_path: Path) -> Iterator[Path]:
@@ -56,9 +55,14 @@ def find_instruction_files(workspace_path: Path) -> Iterator[Path]:
     if not projects_dir.exists():
         return
 
-    for instruction_file in projects_dir.rglob("instruction.yaml"):
-        if instruction_file.is_file():
-            yield instruction_file
+    # os.walk classifies entries from scandir's d_type; hidden directories
+    # (.git, .venv, ...) are pruned in place so their subtrees are never read.
+    # Symlinked directories are not descended, as with Path.rglob on 3.11, so
+    # links out of projects/ or back up the tree cannot repeat or leak tasks.
+    for root, dirnames, filenames in os.walk(projects_dir, followlinks=False):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        if "instruction.yaml" in filenames:
+            yield Path(root) / "instruction.yaml"
 
 
 def create_temp_dir() -> Path:
@@ -74,18 +78,44 @@ def create_temp_dir() -> Path:
     return temp_dir
 
 
+# Upper bound on concurrent copies, shared with execution.file_ops; each
+# in-flight copy holds two descriptors, and the work is I/O- not CPU-bound
+MAX_COPY_WORKERS = 8
+
+
+def _copy_entry(entry: "os.DirEntry[str]", dst: Path) -> None:
+    """Copy one top-level entry of a directory into dst."""
+    if entry.is_file():
+        shutil.copy2(entry.path, dst / entry.name)
+    elif entry.is_dir():
+        shutil.copytree(entry.path, dst / entry.name, dirs_exist_ok=True)
+
+
 def copy_directory_contents(src: Path, dst: Path) -> None:
-    """Copy directory contents to destination."""
+    """Copy directory contents to destination.
+
+    Top-level entries are copied concurrently so I/O latency overlaps, which
+    matters most on network-mounted workspaces.
+    """
     if not src.exists():
         raise FileNotFoundError(f"Source directory not found: {src}")
 
     dst.mkdir(parents=True, exist_ok=True)
 
-    for item in src.iterdir():
-        if item.is_file():
-            shutil.copy2(item, dst / item.name)
-        elif item.is_dir():
-            shutil.copytree(item, dst / item.name, dirs_exist_ok=True)
+    with os.scandir(src) as it:
+        entries = list(it)
+
+    if len(entries) <= 1:
+        for entry in entries:
+            _copy_entry(entry, dst)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, len(entries))) as pool:
+        futures = [pool.submit(_copy_entry, entry, dst) for entry in entries]
+
+    # Re-raise the first copy failure, as the serial loop would have
+    for future in futures:
+        future.result()
 
 
 def ensure_directory(path: Path) -> None:
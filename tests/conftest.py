@@ -5,7 +5,8 @@ import os
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator
+from unittest.mock import Mock
 
 # Set explicit temp directory for CI stability
 if os.getenv("CI"):
@@ -18,6 +19,7 @@ if os.getenv("CI"):
 import pytest
 
 # Local imports
+from tests.helpers import PROJECT_SPEC, TASK_SPEC
 from warifuri.utils import ensure_directory
 
 
@@ -48,3 +50,15 @@ def sample_task_instruction() -> dict:
         "outputs": ["output.txt"],
         "note": "Test note",
     }
+
+
+@pytest.fixture
+def make_task_mock() -> Callable[[], Mock]:
+    """Factory for Task mocks backed by the cached Task spec."""
+    return lambda: Mock(spec_set=TASK_SPEC)
+
+
+@pytest.fixture
+def make_project_mock() -> Callable[[], Mock]:
+    """Factory for Project mocks backed by the cached Project spec."""
+    return lambda: Mock(spec_set=PROJECT_SPEC)
@@ -0,0 +1,46 @@
+"""Shared test helpers: mock specs and model stand-ins.
+
+Kept out of conftest.py so test modules can import them directly; conftest
+only exposes fixtures.
+"""
+
+from dataclasses import fields, make_dataclass
+from typing import Any, List
+
+from warifuri.core.types import Project, Task, TaskInstruction
+
+
+def _spec_attributes(cls: type) -> List[str]:
+    """Collect attribute names (including dataclass fields) usable as a mock spec."""
+    return sorted(set(dir(cls)) | {field.name for field in fields(cls)})
+
+
+# Introspected once per session; Mock(spec_set=<list>) skips the per-mock dir() walk
+TASK_SPEC = _spec_attributes(Task)
+PROJECT_SPEC = _spec_attributes(Project)
+
+
+def _stub_of(model: type, *names: str) -> type:
+    """Frozen, slotted dataclass exposing only the named fields/properties of model.
+
+    Names and types are read from the model, so renaming or removing one there
+    fails at collection instead of leaving a stale hand-written copy here.
+    """
+    model_fields = {field.name: field.type for field in fields(model)}
+    stub_fields = []
+    for name in names:
+        attribute = getattr(model, name, None)
+        if name in model_fields:
+            stub_fields.append((name, model_fields[name]))
+        elif isinstance(attribute, property):
+            stub_fields.append((name, attribute.fget.__annotations__.get("return", Any)))
+        else:
+            raise AttributeError(f"{model.__name__} has no field or property {name!r}")
+    stub = make_dataclass(f"Stub{model.__name__}", stub_fields, frozen=True, slots=True)
+    stub.__doc__ = f"Minimal stand-in for {model.__name__}; unknown attributes raise."
+    return stub
+
+
+# Stand-ins for dependency-graph tests, cut from the real models
+StubInstruction = _stub_of(TaskInstruction, "dependencies")
+StubTask = _stub_of(Task, "full_name", "path", "instruction")
@@ -1,12 +1,20 @@
 """Unit tests for human task execution module."""
 
 from pathlib import Path
+from typing import List
 from unittest.mock import Mock, patch
 
 from warifuri.core.execution.human import execute_human_task
 from warifuri.core.types import Task, TaskInstruction, TaskStatus, TaskType
 
 
+def _logged_lines(mock_logger: Mock) -> List[str]:
+    """Render the single info record and split it into its lines."""
+    mock_logger.info.assert_called_once()
+    fmt, *args = mock_logger.info.call_args.args
+    return str(fmt % tuple(args)).split("\n")
+
+
 class TestExecuteHumanTask:
     """Test execute_human_task function."""
 
@@ -37,13 +45,12 @@ class TestExecuteHumanTask:
         assert result is True
 
         # Verify logging calls
-        mock_logger.info.assert_any_call("Human task: test-project/manual-task")
-        mock_logger.info.assert_any_call(
-            "Human task 'test-project/manual-task' requires manual intervention."
-        )
-        mock_logger.info.assert_any_call("Description: Please do this manually")
-        mock_logger.info.assert_any_call(
-            "Please complete the task manually and run 'warifuri mark-done' when finished."
+        lines = _logged_lines(mock_logger)
+        assert "Human task: test-project/manual-task" in lines
+        assert "Human task 'test-project/manual-task' requires manual intervention." in lines
+        assert "Description: Please do this manually" in lines
+        assert (
+            "Please complete the task manually and run 'warifuri mark-done' when finished." in lines
         )
 
     @patch("warifuri.core.execution.human.logger")
@@ -56,9 +63,10 @@ class TestExecuteHumanTask:
         assert result is True
 
         # Verify logging calls
-        mock_logger.info.assert_any_call("Human task: test-project/manual-task")
-        mock_logger.info.assert_any_call(
-            "[DRY RUN] Human task requires manual intervention: test-project/manual-task"
+        lines = _logged_lines(mock_logger)
+        assert "Human task: test-project/manual-task" in lines
+        assert (
+            "[DRY RUN] Human task requires manual intervention: test-project/manual-task" in lines
         )
 
     @patch("warifuri.core.execution.human.logger")
@@ -69,7 +77,9 @@ class TestExecuteHumanTask:
         result = execute_human_task(task, dry_run=False)
 
         assert result is True
-        mock_logger.info.assert_any_call("Human task: test-project/complex-task-name-with-hyphens")
+        assert "Human task: test-project/complex-task-name-with-hyphens" in _logged_lines(
+            mock_logger
+        )
 
     @patch("warifuri.core.execution.human.logger")
     def test_execute_human_task_empty_description(self, mock_logger: Mock) -> None:
@@ -79,7 +89,7 @@ class TestExecuteHumanTask:
         result = execute_human_task(task, dry_run=False)
 
         assert result is True
-        mock_logger.info.assert_any_call("Description: ")
+        assert "Description: " in _logged_lines(mock_logger)
 
     @patch("warifuri.core.execution.human.logger")
     def test_execute_human_task_long_description(self, mock_logger: Mock) -> None:
@@ -90,7 +100,7 @@ class TestExecuteHumanTask:
         result = execute_human_task(task, dry_run=False)
 
         assert result is True
-        mock_logger.info.assert_any_call(f"Description: {long_description}")
+        assert f"Description: {long_description}" in _logged_lines(mock_logger)
 
     def test_execute_human_task_return_value(self) -> None:
         """Test that human task execution always returns True."""
@@ -104,39 +114,35 @@ class TestExecuteHumanTask:
 
     @patch("warifuri.core.execution.human.logger")
     def test_execute_human_task_logging_order(self, mock_logger: Mock) -> None:
-        """Test the order of logging calls."""
+        """Test the order of lines in the single info record."""
         task = self.create_mock_task("test-task", "Test description")
 
         execute_human_task(task, dry_run=False)
 
-        # Get all the info calls made to logger
-        info_calls = [call.args[0] for call in mock_logger.info.call_args_list]
-
-        # Verify the order
-        assert info_calls[0] == "Human task: test-project/test-task"
-        assert info_calls[1] == "Human task 'test-project/test-task' requires manual intervention."
-        assert info_calls[2] == "Description: Test description"
-        assert (
-            info_calls[3]
-            == "Please complete the task manually and run 'warifuri mark-done' when finished."
+        assert mock_logger.info.call_args_list[0].args == (
+            "Human task: %s\n"
+            "Human task '%s' requires manual intervention.\n"
+            "Description: %s\n"
+            "Please complete the task manually and run 'warifuri mark-done' when finished.",
+            "test-project/test-task",
+            "test-project/test-task",
+            "Test description",
         )
+        assert _logged_lines(mock_logger) == [
+            "Human task: test-project/test-task",
+            "Human task 'test-project/test-task' requires manual intervention.",
+            "Description: Test description",
+            "Please complete the task manually and run 'warifuri mark-done' when finished.",
+        ]
 
     @patch("warifuri.core.execution.human.logger")
     def test_execute_human_task_dry_run_logging_order(self, mock_logger: Mock) -> None:
-        """Test the order of logging calls in dry run mode."""
+        """Test the order of lines in dry run mode."""
         task = self.create_mock_task("test-task", "Test description")
 
         execute_human_task(task, dry_run=True)
 
-        # Get all the info calls made to logger
-        info_calls = [call.args[0] for call in mock_logger.info.call_args_list]
-
-        # Verify the order
-        assert info_calls[0] == "Human task: test-project/test-task"
-        assert (
-            info_calls[1]
-            == "[DRY RUN] Human task requires manual intervention: test-project/test-task"
-        )
-
-        # Should not have the additional messages in dry run mode
-        assert len(info_calls) == 2
+        assert _logged_lines(mock_logger) == [
+            "Human task: test-project/test-task",
+            "[DRY RUN] Human task requires manual intervention: test-project/test-task",
+        ]
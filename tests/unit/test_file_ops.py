@@ -1,176 +1,248 @@
 """Unit tests for file operations module."""
 
-import tempfile
+import os
+from dataclasses import replace
 from pathlib import Path
-from typing import List
+from typing import Any, List
 from unittest.mock import patch
 
-from warifuri.core.execution.file_ops import _copy_file_or_directory, copy_input_files
+import pytest
+from pytest_mock import MockerFixture
+
+from warifuri.core.execution import file_ops
+from warifuri.core.execution.file_ops import (
+    _copy_file_or_directory,
+    _flatten_cross_project_input,
+    copy_input_files,
+)
 from warifuri.core.types import Task, TaskInstruction, TaskStatus, TaskType
 
 
+@pytest.fixture(scope="module")
+def base_task() -> Task:
+    """Prototype machine task; tests derive variants with _with_inputs()."""
+    return Task(
+        project="test_project",
+        name="test_task",
+        path=Path("/workspace/project/task.yaml"),
+        instruction=TaskInstruction(
+            name="test_task",
+            description="Test task description",
+            dependencies=[],
+            inputs=[],
+            outputs=[],
+        ),
+        task_type=TaskType.MACHINE,
+        status=TaskStatus.READY,
+    )
+
+
+def _assert_logged(log: List[str], *messages: str) -> None:
+    """Assert every message appears in log, snapshotting it into a set once."""
+    logged = set(log)
+    missing = [message for message in messages if message not in logged]
+    assert not missing, f"missing log lines {missing!r} in {log!r}"
+
+
+def _with_inputs(task: Task, inputs: List[str], **changes: Any) -> Task:
+    """Copy task with new inputs (and any other Task field changes)."""
+    return replace(task, instruction=replace(task.instruction, inputs=inputs), **changes)
+
+
 class TestCopyInputFiles:
     """Test copy_input_files function."""
 
-    def setup_method(self) -> None:
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path: Path, base_task: Task, mocker: MockerFixture) -> None:
         """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = tmp_path / "exec"
+        self.temp_dir.mkdir()
         self.execution_log: List[str] = []
-
-        # Create mock task
-        self.task_instruction = TaskInstruction(
-            name="test_task",
-            description="Test task description",
-            dependencies=[],
-            inputs=["test_file.txt"],
-            outputs=[],
-        )
-        self.task = Task(
-            project="test_project",
-            name="test_task",
-            path=Path("/workspace/project/task.yaml"),
-            instruction=self.task_instruction,
-            task_type=TaskType.MACHINE,
-            status=TaskStatus.READY,
-        )
+        self.task = _with_inputs(base_task, ["test_file.txt"])
+        # Patched once per test via the module object rather than a dotted path per `with`
+        self.mock_resolve = mocker.patch.object(file_ops, "_resolve_input_path_safely")
 
     def test_no_input_files(self) -> None:
         """Test when task has no input files."""
-        task_instruction = TaskInstruction(
-            name="test_task",
-            description="Test task description",
-            dependencies=[],
-            inputs=[],
-            outputs=[],
-        )
-        task = Task(
-            project="test_project",
-            name="test_task",
-            path=Path("/workspace/project/task.yaml"),
-            instruction=task_instruction,
-            task_type=TaskType.MACHINE,
-            status=TaskStatus.READY,
-        )
+        task = _with_inputs(self.task, [])
 
         copy_input_files(task, self.temp_dir, self.execution_log)
 
-        assert "No input files to copy" in self.execution_log
+        _assert_logged(self.execution_log, "No input files to copy")
+        self.mock_resolve.assert_not_called()
 
     def test_workspace_path_none_derives_from_task_path(self) -> None:
         """Test that workspace_path is derived from task.path when None."""
-        with patch("warifuri.core.execution.file_ops._resolve_input_path_safely") as mock_resolve:
-            mock_resolve.return_value = (None, "File not found")
+        self.mock_resolve.return_value = (None, "File not found")
 
-            copy_input_files(self.task, self.temp_dir, self.execution_log, workspace_path=None)
+        copy_input_files(self.task, self.temp_dir, self.execution_log, workspace_path=None)
 
-            # Verify that _resolve_input_path_safely was called with correct projects_base
-            expected_projects_base = self.task.path.parent.parent.parent / "projects"
-            mock_resolve.assert_called_once_with(
-                "test_file.txt", self.task.path, expected_projects_base
-            )
+        # Verify that _resolve_input_path_safely was called with correct projects_base
+        expected_projects_base = self.task.path.parent.parent.parent / "projects"
+        self.mock_resolve.assert_called_once_with(
+            "test_file.txt", self.task.path, expected_projects_base
+        )
 
     def test_source_path_none_continues(self) -> None:
         """Test that function continues when source_path is None."""
-        with patch("warifuri.core.execution.file_ops._resolve_input_path_safely") as mock_resolve:
-            mock_resolve.return_value = (None, "File not found")
+        self.mock_resolve.return_value = (None, "File not found")
 
-            copy_input_files(self.task, self.temp_dir, self.execution_log)
+        copy_input_files(self.task, self.temp_dir, self.execution_log)
 
-            assert "Copying input files to temporary directory..." in self.execution_log
-            assert "File not found" in self.execution_log
-            # Should not attempt to copy anything
+        _assert_logged(
+            self.execution_log,
+            "Copying input files to temporary directory...",
+            "File not found",
+        )
+        # Should not attempt to copy anything
 
     def test_source_file_not_exists(self) -> None:
         """Test error handling when source file doesn't exist."""
         non_existent_path = Path("/non/existent/file.txt")
+        self.mock_resolve.return_value = (non_existent_path, "Resolved path")
 
-        with patch("warifuri.core.execution.file_ops._resolve_input_path_safely") as mock_resolve:
-            mock_resolve.return_value = (non_existent_path, "Resolved path")
+        copy_input_files(self.task, self.temp_dir, self.execution_log)
 
-            copy_input_files(self.task, self.temp_dir, self.execution_log)
+        expected_error = f"ERROR: Input file not found during copy: {non_existent_path}"
+        _assert_logged(self.execution_log, expected_error)
 
-            expected_error = f"ERROR: Input file not found during copy: {non_existent_path}"
-            assert expected_error in self.execution_log
-
-    def test_copy_cross_project_file(self) -> None:
+    def test_copy_cross_project_file(self, tmp_path: Path, mocker: MockerFixture) -> None:
         """Test copying cross-project files with flattened structure."""
-        # Create a real file to copy
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_file:
-            temp_file.write("test content")
-            source_path = Path(temp_file.name)
-
-        try:
-            task_instruction = TaskInstruction(
-                name="test_task",
-                description="Test task description",
-                dependencies=[],
-                inputs=["../other-project/file.txt"],
-                outputs=[],
-            )
-            task = Task(
-                project="test_project",
-                name="test_task",
-                path=Path("/workspace/project/task.yaml"),
-                instruction=task_instruction,
-                task_type=TaskType.MACHINE,
-                status=TaskStatus.READY,
-            )
-
-            with patch(
-                "warifuri.core.execution.file_ops._resolve_input_path_safely"
-            ) as mock_resolve:
-                mock_resolve.return_value = (source_path, "Resolved cross-project file")
-
-                with patch("warifuri.core.execution.file_ops._copy_file_or_directory") as mock_copy:
-                    copy_input_files(task, self.temp_dir, self.execution_log)
-
-                    # Verify the destination path is flattened
-                    expected_dest = self.temp_dir / "other-project_file.txt"
-                    mock_copy.assert_called_once_with(
-                        source_path, expected_dest, "../other-project/file.txt", self.execution_log
-                    )
-        finally:
-            source_path.unlink()
-
-    def test_copy_local_file_preserves_structure(self) -> None:
+        source_path = tmp_path / "file.txt"
+        source_path.write_text("test content")
+        task = _with_inputs(self.task, ["../other-project/file.txt"])
+        self.mock_resolve.return_value = (source_path, "Resolved cross-project file")
+        mock_copy = mocker.patch.object(file_ops, "_copy_file_or_directory")
+
+        copy_input_files(task, self.temp_dir, self.execution_log)
+
+        # Verify the destination path is flattened
+        expected_dest = self.temp_dir / "other-project_file.txt"
+        mock_copy.assert_called_once_with(
+            source_path, expected_dest, "../other-project/file.txt", self.execution_log
+        )
+
+    def test_copy_local_file_preserves_structure(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
         """Test copying local files preserves relative structure."""
-        # Create a real file to copy
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_file:
-            temp_file.write("test content")
-            source_path = Path(temp_file.name)
-
-        try:
-            task_instruction = TaskInstruction(
-                name="test_task",
-                description="Test task description",
-                dependencies=[],
-                inputs=["subdir/file.txt"],
-                outputs=[],
-            )
-            task = Task(
-                project="test_project",
-                name="test_task",
-                path=Path("/workspace/project/task.yaml"),
-                instruction=task_instruction,
-                task_type=TaskType.MACHINE,
-                status=TaskStatus.READY,
-            )
-
-            with patch(
-                "warifuri.core.execution.file_ops._resolve_input_path_safely"
-            ) as mock_resolve:
-                mock_resolve.return_value = (source_path, "Resolved local file")
-
-                with patch("warifuri.core.execution.file_ops._copy_file_or_directory") as mock_copy:
-                    copy_input_files(task, self.temp_dir, self.execution_log)
-
-                    # Verify the destination path preserves structure
-                    expected_dest = self.temp_dir / "subdir/file.txt"
-                    mock_copy.assert_called_once_with(
-                        source_path, expected_dest, "subdir/file.txt", self.execution_log
-                    )
-        finally:
-            source_path.unlink()
+        source_path = tmp_path / "file.txt"
+        source_path.write_text("test content")
+        task = _with_inputs(self.task, ["subdir/file.txt"])
+        self.mock_resolve.return_value = (source_path, "Resolved local file")
+        mock_copy = mocker.patch.object(file_ops, "_copy_file_or_directory")
+
+        copy_input_files(task, self.temp_dir, self.execution_log)
+
+        # Verify the destination path preserves structure
+        expected_dest = self.temp_dir / "subdir/file.txt"
+        mock_copy.assert_called_once_with(
+            source_path, expected_dest, "subdir/file.txt", self.execution_log
+        )
+
+    def test_copy_multiple_inputs_logs_in_input_order(self, tmp_path: Path) -> None:
+        """Test that concurrent copies of several inputs keep log order deterministic."""
+        names = [f"input_{i}.txt" for i in range(5)]
+        sources = {}
+        for name in names:
+            sources[name] = tmp_path / "src" / name
+            sources[name].parent.mkdir(exist_ok=True)
+            sources[name].write_text(f"content of {name}")
+
+        task = _with_inputs(self.task, names)
+        dest_dir = tmp_path / "dest"
+        dest_dir.mkdir()
+        self.mock_resolve.side_effect = lambda name, *_: (sources[name], f"Resolved {name}")
+
+        copy_input_files(task, dest_dir, self.execution_log)
+
+        for name in names:
+            assert (dest_dir / name).read_text() == f"content of {name}"
+        copied = [line for line in self.execution_log if line.startswith("Copied input file")]
+        assert copied == [f"Copied input file: {name} -> {dest_dir / name}" for name in names]
+
+    def test_colliding_destinations_copy_serially_last_wins(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that inputs flattened onto one destination are copied in input order."""
+        names = ["../a/b_c.txt", "../a_b/c.txt"]
+        sources = {}
+        for i, name in enumerate(names):
+            sources[name] = tmp_path / f"source_{i}.txt"
+            sources[name].write_text(f"content of {name}")
+        task = _with_inputs(self.task, names)
+        self.mock_resolve.side_effect = lambda name, *_: (sources[name], f"Resolved {name}")
+        mock_pool = mocker.patch.object(file_ops, "ThreadPoolExecutor")
+
+        copy_input_files(task, self.temp_dir, self.execution_log)
+
+        mock_pool.assert_not_called()
+        assert (self.temp_dir / "a_b_c.txt").read_text() == "content of ../a_b/c.txt"
+
+    def test_shared_destination_dir_created_once(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that inputs sharing a destination directory only mkdir it once."""
+        source = tmp_path / "source.txt"
+        source.write_text("data")
+        task = _with_inputs(self.task, ["data/a.txt", "data/b.txt", "data/c.txt"])
+        self.mock_resolve.return_value = (source, "Resolved")
+        mocker.patch.object(file_ops, "_copy_file_or_directory")
+        mock_mkdir = mocker.patch.object(Path, "mkdir")
+
+        copy_input_files(task, self.temp_dir, self.execution_log)
+
+        mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+
+    def test_top_level_inputs_skip_mkdir(self, tmp_path: Path, mocker: MockerFixture) -> None:
+        """Test that inputs landing directly in temp_dir issue no mkdir at all."""
+        source = tmp_path / "source.txt"
+        source.write_text("data")
+        task = _with_inputs(self.task, ["a.txt", "b.txt"])
+        self.mock_resolve.return_value = (source, "Resolved")
+        mocker.patch.object(file_ops, "_copy_file_or_directory")
+        mock_mkdir = mocker.patch.object(Path, "mkdir")
+
+        copy_input_files(task, self.temp_dir, self.execution_log)
+
+        mock_mkdir.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "destinations, expected",
+    [
+        (["a.txt", "b.txt", "data/c.txt"], False),
+        (["a.txt", "a.txt"], True),
+        (["data", "data/c.txt"], True),
+        (["data/c.txt", "data"], True),
+    ],
+    ids=["disjoint", "same-destination", "nested-after", "nested-before"],
+)
+def test_has_overlapping_destinations(destinations: List[str], expected: bool) -> None:
+    """Test detection of destinations that collide or nest inside one another."""
+    jobs = [(Path("/src") / dest, Path("/tmp/exec") / dest, dest) for dest in destinations]
+
+    assert file_ops._has_overlapping_destinations(jobs) is expected
+
+
+class TestFlattenCrossProjectInput:
+    """Test _flatten_cross_project_input function."""
+
+    @pytest.mark.parametrize(
+        ("input_file", "expected"),
+        [
+            ("../other-project/file.txt", "other-project_file.txt"),
+            ("../../proj/task/out.json", "proj_task_out.json"),
+            ("../proj/a/../b.txt", "proj_a_b.txt"),
+            ("../x/..", "x_.."),
+            ("../a/.../b", "a_.b"),
+        ],
+        ids=["single-level", "multi-level", "inner-parent", "trailing-parent", "triple-dot"],
+    )
+    def test_flatten_matches_legacy_naming(self, input_file: str, expected: str) -> None:
+        """Test that inputs flatten exactly as the old replace() chain did."""
+        assert _flatten_cross_project_input(input_file) == expected
+        assert expected == input_file.replace("../", "").replace("/", "_")
 
 
 class TestCopyFileOrDirectory:
@@ -180,54 +252,50 @@ class TestCopyFileOrDirectory:
         """Set up test fixtures."""
         self.execution_log: List[str] = []
 
-    def test_copy_file(self) -> None:
+    def test_copy_file(self, tmp_path: Path) -> None:
         """Test copying a single file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_file:
-            temp_file.write("test content")
-            source_path = Path(temp_file.name)
+        source_path = tmp_path / "source.txt"
+        source_path.write_text("test content")
+        dest_path = tmp_path / "dest_file.txt"
 
-        dest_path = Path(tempfile.mkdtemp()) / "dest_file.txt"
+        _copy_file_or_directory(source_path, dest_path, "test_file.txt", self.execution_log)
 
-        try:
-            _copy_file_or_directory(source_path, dest_path, "test_file.txt", self.execution_log)
+        assert dest_path.exists()
+        assert dest_path.read_text() == "test content"
+        _assert_logged(self.execution_log, f"Copied input file: test_file.txt -> {dest_path}")
 
-            assert dest_path.exists()
-            assert dest_path.read_text() == "test content"
-            assert f"Copied input file: test_file.txt -> {dest_path}" in self.execution_log
-        finally:
-            source_path.unlink()
-            if dest_path.exists():
-                dest_path.unlink()
-            dest_path.parent.rmdir()
+    def test_copy_large_file(self, tmp_path: Path) -> None:
+        """Test that large files are copied byte-identical with their metadata."""
+        source_path = tmp_path / "large.bin"
+        payload = os.urandom(4 * 1024 * 1024 + 123)
+        source_path.write_bytes(payload)
+        dest_path = tmp_path / "out" / "large.bin"
+        dest_path.parent.mkdir()
 
-    def test_copy_directory(self) -> None:
-        """Test copying a directory."""
-        # Create temporary source directory with content
-        source_dir = Path(tempfile.mkdtemp())
-        test_file = source_dir / "test.txt"
-        test_file.write_text("test content")
+        _copy_file_or_directory(source_path, dest_path, "large.bin", self.execution_log)
 
-        dest_dir = Path(tempfile.mkdtemp()) / "dest_dir"
+        assert dest_path.read_bytes() == payload
+        assert dest_path.stat().st_mtime_ns == source_path.stat().st_mtime_ns
 
-        try:
-            _copy_file_or_directory(source_dir, dest_dir, "test_dir", self.execution_log)
+    def test_copy_directory(self, tmp_path: Path) -> None:
+        """Test copying a directory."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "test.txt").write_text("test content")
+        dest_dir = tmp_path / "dest_dir"
 
-            assert dest_dir.exists()
-            assert dest_dir.is_dir()
-            assert (dest_dir / "test.txt").exists()
-            assert (dest_dir / "test.txt").read_text() == "test content"
-            assert f"Copied input directory: test_dir -> {dest_dir}" in self.execution_log
-        finally:
-            # Clean up
-            import shutil
+        _copy_file_or_directory(source_dir, dest_dir, "test_dir", self.execution_log)
 
-            shutil.rmtree(source_dir)
-            shutil.rmtree(dest_dir.parent)
+        assert dest_dir.exists()
+        assert dest_dir.is_dir()
+        assert (dest_dir / "test.txt").exists()
+        assert (dest_dir / "test.txt").read_text() == "test content"
+        _assert_logged(self.execution_log, f"Copied input directory: test_dir -> {dest_dir}")
 
-    def test_copy_error_handling(self) -> None:
+    def test_copy_error_handling(self, tmp_path: Path) -> None:
         """Test error handling during copy operation."""
         source_path = Path("/non/existent/source")
-        dest_path = Path("/tmp/dest")
+        dest_path = tmp_path / "dest"
 
         _copy_file_or_directory(source_path, dest_path, "error_file", self.execution_log)
 
@@ -236,93 +304,64 @@ class TestCopyFileOrDirectory:
         assert len(error_logs) == 1
         assert "ERROR copying input error_file:" in error_logs[0]
 
-    def test_copy_directory_with_existing_dest(self) -> None:
+    def test_copy_directory_with_existing_dest(self, tmp_path: Path) -> None:
         """Test copying directory when destination already exists."""
-        # Create temporary source directory
-        source_dir = Path(tempfile.mkdtemp())
-        source_file = source_dir / "source.txt"
-        source_file.write_text("source content")
-
-        # Create temporary destination directory with existing content
-        dest_parent = Path(tempfile.mkdtemp())
-        dest_dir = dest_parent / "dest"
-        dest_dir.mkdir()
-        existing_file = dest_dir / "existing.txt"
-        existing_file.write_text("existing content")
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "source.txt").write_text("source content")
 
-        try:
-            _copy_file_or_directory(source_dir, dest_dir, "test_dir", self.execution_log)
+        # Destination directory with existing content
+        dest_dir = tmp_path / "dest"
+        dest_dir.mkdir()
+        (dest_dir / "existing.txt").write_text("existing content")
 
-            # Both files should exist
-            assert (dest_dir / "source.txt").exists()
-            assert (dest_dir / "existing.txt").exists()
-            assert (dest_dir / "source.txt").read_text() == "source content"
-            assert (dest_dir / "existing.txt").read_text() == "existing content"
+        _copy_file_or_directory(source_dir, dest_dir, "test_dir", self.execution_log)
 
-            assert f"Copied input directory: test_dir -> {dest_dir}" in self.execution_log
-        finally:
-            import shutil
+        # Both files should exist
+        assert (dest_dir / "source.txt").exists()
+        assert (dest_dir / "existing.txt").exists()
+        assert (dest_dir / "source.txt").read_text() == "source content"
+        assert (dest_dir / "existing.txt").read_text() == "existing content"
 
-            shutil.rmtree(source_dir)
-            shutil.rmtree(dest_parent)
+        _assert_logged(self.execution_log, f"Copied input directory: test_dir -> {dest_dir}")
 
 
 class TestIntegration:
     """Integration tests for file operations."""
 
-    def test_complete_workflow_mocked(self) -> None:
+    def test_complete_workflow_mocked(self, base_task: Task, tmp_path: Path) -> None:
         """Test complete file copying workflow with mocked validation."""
         # Create a temporary workspace structure
-        workspace = Path(tempfile.mkdtemp())
-        projects_dir = workspace / "projects"
-        projects_dir.mkdir()
-
-        # Create source files
-        project_dir = projects_dir / "test-project"
-        project_dir.mkdir()
+        workspace = tmp_path / "workspace"
+        project_dir = workspace / "projects" / "test-project"
+        project_dir.mkdir(parents=True)
         source_file = project_dir / "input.txt"
         source_file.write_text("input content")
 
         # Create task
-        task_instruction = TaskInstruction(
-            name="test_task",
-            description="Test task description",
-            dependencies=[],
-            inputs=["input.txt"],
-            outputs=[],
-        )
-        task = Task(
-            project="test-project",
-            name="test_task",
-            path=project_dir / "task.yaml",
-            instruction=task_instruction,
-            task_type=TaskType.MACHINE,
-            status=TaskStatus.READY,
+        task = _with_inputs(
+            base_task, ["input.txt"], project="test-project", path=project_dir / "task.yaml"
         )
 
         # Create destination
-        temp_dir = Path(tempfile.mkdtemp())
+        temp_dir = tmp_path / "exec"
+        temp_dir.mkdir()
         execution_log: List[str] = []
 
-        try:
-            # Mock the validation function to return the source file
-            with patch(
-                "warifuri.core.execution.file_ops._resolve_input_path_safely"
-            ) as mock_resolve:
-                mock_resolve.return_value = (source_file, "Resolved input.txt")
-
-                copy_input_files(task, temp_dir, execution_log, workspace_path=workspace)
-
-                # Verify file was copied
-                dest_file = temp_dir / "input.txt"
-                assert dest_file.exists()
-                assert dest_file.read_text() == "input content"
-
-                # Verify logs
-                assert "Copying input files to temporary directory..." in execution_log
-                assert f"Copied input file: input.txt -> {dest_file}" in execution_log
-        finally:
-            import shutil
-
-            shutil.rmtree(workspace)
-            shutil.rmtree(temp_dir)
+        # Mock the validation function to return the source file
+        with patch.object(
+            file_ops, "_resolve_input_path_safely", return_value=(source_file, "Resolved input.txt")
+        ):
+            copy_input_files(task, temp_dir, execution_log, workspace_path=workspace)
+
+        # Verify file was copied
+        dest_file = temp_dir / "input.txt"
+        assert dest_file.exists()
+        assert dest_file.read_text() == "input content"
+
+        # Verify logs
+        _assert_logged(
+            execution_log,
+            "Copying input files to temporary directory...",
+            f"Copied input file: input.txt -> {dest_file}",
+        )
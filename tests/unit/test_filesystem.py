@@ -87,6 +87,23 @@ class TestListProjects:
         projects = list_projects(tmp_path)
         assert set(projects) == {"project1", "project2", "project3"}
 
+    def test_list_projects_follows_symlinked_project(self, tmp_path: Path) -> None:
+        """Test that a symlinked project directory is still listed."""
+        projects_dir = tmp_path / "projects"
+        projects_dir.mkdir()
+        real_project = tmp_path / "elsewhere"
+        real_project.mkdir()
+        (projects_dir / "linked").symlink_to(real_project, target_is_directory=True)
+
+        assert list_projects(tmp_path) == ["linked"]
+
+    def test_list_projects_projects_is_file(self, tmp_path: Path) -> None:
+        """Test that a projects path that is a file raises rather than looking empty."""
+        (tmp_path / "projects").touch()
+
+        with pytest.raises(NotADirectoryError):
+            list_projects(tmp_path)
+
     def test_list_projects_no_projects_dir(self, tmp_path: Path) -> None:
         """Test listing projects when projects/ doesn't exist."""
         projects = list_projects(tmp_path)
@@ -145,6 +162,34 @@ class TestFindInstructionFiles:
         assert inst1 in files
         assert inst2 in files
 
+    def test_find_instruction_files_skips_hidden_dirs(self, tmp_path: Path) -> None:
+        """Test that hidden directories are pruned from the walk."""
+        task_dir = tmp_path / "projects" / "project1" / "task1"
+        task_dir.mkdir(parents=True)
+        (task_dir / "instruction.yaml").touch()
+
+        hidden_dir = tmp_path / "projects" / "project1" / ".git" / "task"
+        hidden_dir.mkdir(parents=True)
+        (hidden_dir / "instruction.yaml").touch()
+
+        files = list(find_instruction_files(tmp_path))
+        assert files == [task_dir / "instruction.yaml"]
+
+    def test_find_instruction_files_does_not_follow_symlinks(self, tmp_path: Path) -> None:
+        """Test that symlink loops and links escaping projects/ are not walked."""
+        task_dir = tmp_path / "projects" / "real" / "task1"
+        task_dir.mkdir(parents=True)
+        (task_dir / "instruction.yaml").touch()
+        (tmp_path / "projects" / "real" / "loop").symlink_to("..", target_is_directory=True)
+
+        outside_task = tmp_path / "outside" / "task2"
+        outside_task.mkdir(parents=True)
+        (outside_task / "instruction.yaml").touch()
+        (tmp_path / "projects" / "linked").symlink_to("../outside", target_is_directory=True)
+
+        files = list(find_instruction_files(tmp_path))
+        assert files == [task_dir / "instruction.yaml"]
+
     def test_find_instruction_files_no_projects_dir(self, tmp_path: Path) -> None:
         """Test finding instruction files when projects/ doesn't exist."""
         files = list(find_instruction_files(tmp_path))
@@ -201,6 +246,35 @@ class TestCopyDirectoryContents:
         assert (dst / "file2.txt").read_text() == "content2"
         assert (dst / "subdir" / "nested.txt").read_text() == "nested content"
 
+    def test_copy_directory_contents_many_entries(self, tmp_path: Path) -> None:
+        """Test that concurrent copying reproduces a wide tree exactly."""
+        src = tmp_path / "src"
+        dst = tmp_path / "dst"
+        src.mkdir()
+
+        for i in range(20):
+            (src / f"file{i}.txt").write_text(f"content{i}")
+            nested = src / f"dir{i}" / "inner"
+            nested.mkdir(parents=True)
+            (nested / "leaf.txt").write_text(f"leaf{i}")
+
+        copy_directory_contents(src, dst)
+
+        for i in range(20):
+            assert (dst / f"file{i}.txt").read_text() == f"content{i}"
+            assert (dst / f"dir{i}" / "inner" / "leaf.txt").read_text() == f"leaf{i}"
+
+    def test_copy_directory_contents_propagates_copy_error(self, tmp_path: Path) -> None:
+        """Test that a failure in a worker surfaces to the caller."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.txt").write_text("a")
+        (src / "b.txt").write_text("b")
+
+        with patch("warifuri.utils.filesystem.shutil.copy2", side_effect=PermissionError("denied")):
+            with pytest.raises(PermissionError, match="denied"):
+                copy_directory_contents(src, tmp_path / "dst")
+
     def test_copy_directory_contents_source_not_found(self, tmp_path: Path) -> None:
         """Test copying from non-existent source directory."""
         src = tmp_path / "nonexistent"
@@ -1,11 +1,17 @@
 """Tests for GitHub integration."""
 
 import json
-import os
 import subprocess
+from dataclasses import replace
+from functools import partial
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Union
+from unittest.mock import Mock, call, patch
 
+import pytest
+
+from warifuri.core import github
 from warifuri.core.github import (
     _add_dependencies_section,
     _add_files_sections,
@@ -34,195 +40,230 @@ from warifuri.core.github import (
 )
 from warifuri.core.types import Project, Task, TaskInstruction, TaskStatus, TaskType
 
-
-class TestGetGithubRepo:
-    """Test get_github_repo function."""
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_get_github_repo_https_url(self, mock_run: Mock) -> None:
-        """Test getting GitHub repo from HTTPS URL."""
-        mock_result = Mock()
-        mock_result.stdout = "https://github.com/user/repo.git\n"
-        mock_run.return_value = mock_result
-
-        repo = get_github_repo()
-        assert repo == "user/repo"
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_get_github_repo_ssh_url(self, mock_run: Mock) -> None:
-        """Test getting GitHub repo from SSH URL."""
-        mock_result = Mock()
-        mock_result.stdout = "git@github.com:user/repo.git\n"
-        mock_run.return_value = mock_result
-
-        repo = get_github_repo()
-        assert repo == "user/repo"
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_get_github_repo_https_without_git(self, mock_run: Mock) -> None:
-        """Test getting GitHub repo from HTTPS URL without .git."""
-        mock_result = Mock()
-        mock_result.stdout = "https://github.com/user/repo\n"
-        mock_run.return_value = mock_result
-
-        repo = get_github_repo()
-        assert repo == "user/repo"
-
-    @patch("warifuri.core.github.os.environ.get")
-    @patch("warifuri.core.github.subprocess.run")
-    def test_get_github_repo_non_github_url(self, mock_run: Mock, mock_env: Mock) -> None:
-        """Test with non-GitHub URL."""
-        mock_result = Mock()
-        mock_result.stdout = "https://gitlab.com/user/repo.git\n"
-        mock_run.return_value = mock_result
-        mock_env.return_value = None  # No GITHUB_REPOSITORY environment variable
-
-        repo = get_github_repo()
-        assert repo is None
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_get_github_repo_command_error(self, mock_run: Mock) -> None:
-        """Test when git command fails."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "git")
-
-        with patch.dict(os.environ, {"GITHUB_REPOSITORY": "env/repo"}):
-            repo = get_github_repo()
-            assert repo == "env/repo"
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_get_github_repo_no_env_fallback(self, mock_run: Mock) -> None:
-        """Test when git fails and no environment variable."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "git")
-
-        with patch.dict(os.environ, {}, clear=True):
-            repo = get_github_repo()
-            assert repo is None
-
-
-class TestCheckGithubCli:
-    """Test check_github_cli function."""
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_check_github_cli_success(self, mock_run: Mock) -> None:
-        """Test successful GitHub CLI check."""
-        # Mock gh --version success
-        mock_run.return_value = Mock()
-
-        # Mock gh auth status with returncode 0 (authenticated)
-        mock_auth_result = Mock()
-        mock_auth_result.returncode = 0
-
-        mock_run.side_effect = [Mock(), mock_auth_result]
-
-        result = check_github_cli()
-        assert result is True
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_check_github_cli_not_installed(self, mock_run: Mock) -> None:
-        """Test when GitHub CLI is not installed."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "gh")
-
-        result = check_github_cli()
-        assert result is False
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_check_github_cli_not_authenticated(self, mock_run: Mock) -> None:
-        """Test when GitHub CLI is not authenticated."""
-        # Mock gh --version success
-        mock_version_result = Mock()
-
-        # Mock gh auth status with returncode 1 (not authenticated)
-        mock_auth_result = Mock()
-        mock_auth_result.returncode = 1
-
-        mock_run.side_effect = [mock_version_result, mock_auth_result]
-
-        result = check_github_cli()
-        assert result is False
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_check_github_cli_file_not_found(self, mock_run: Mock) -> None:
-        """Test when gh command is not found."""
-        mock_run.side_effect = FileNotFoundError("gh command not found")
-
-        result = check_github_cli()
-        assert result is False
+# gh --json payloads, encoded once at import
+_LABELS_JSON = json.dumps([{"name": "bug"}, {"name": "feature"}, {"name": "enhancement"}])
+_ISSUES_JSON = json.dumps([{"title": "Test Issue"}, {"title": "Another Issue"}])
+_PARENT_ISSUES_JSON = json.dumps(
+    [{"title": "[PROJECT] test-project", "url": "https://github.com/user/repo/issues/123"}]
+)
 
 
-class TestIsWorkingDirectoryClean:
-    """Test is_working_directory_clean function."""
+# Expected subprocess.run argument lists, built once at import
+_PR_URL = "https://github.com/user/repo/pull/123"
+_CURRENT_BRANCH_CMD = ["git", "branch", "--show-current"]
+_PUSH_CMD = ["git", "push", "-u", "origin", "feature-branch"]
+_AUTO_MERGE_CMD = ["gh", "pr", "merge", _PR_URL, "--auto", "--squash"]
+_MERGE_CMD = ["gh", "pr", "merge", _PR_URL, "--squash", "--delete-branch"]
+_LABEL_LIST_CMD = ["gh", "label", "list", "--repo", "user/repo", "--json", "name"]
+_PARENT_ISSUE_SEARCH_CMD = [
+    "gh",
+    "issue",
+    "list",
+    "--repo",
+    "user/repo",
+    "--search",
+    '"[PROJECT] test-project" in:title',
+    "--json",
+    "title,url",
+]
+_PROJECT_PATH = Path("/test/path/test-project")
+
+
+@pytest.fixture
+def mock_run(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace subprocess.run as seen by warifuri.core.github with a fresh Mock.
+
+    github's module-level ``subprocess`` name is swapped for a namespace, so
+    the real subprocess module stays untouched for everything else.
+    """
+    run = Mock()
+    monkeypatch.setattr(
+        github,
+        "subprocess",
+        SimpleNamespace(run=run, CalledProcessError=subprocess.CalledProcessError),
+    )
+    return run
+
+
+def _result(**fields: Any) -> SimpleNamespace:
+    """Stand-in for a CompletedProcess; only the given attributes exist."""
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture(scope="module")
+def sample_task() -> Task:
+    """Prototype task shared by the issue body tests; derive variants with replace()."""
+    return Task(
+        project="test-project",
+        name="test-task",
+        path=_PROJECT_PATH / "test-task",
+        instruction=TaskInstruction(
+            name="test-task",
+            description="Test description",
+            dependencies=[],
+            inputs=[],
+            outputs=[],
+            note="",
+        ),
+        task_type=TaskType.MACHINE,
+        status=TaskStatus.READY,
+    )
+
+
+@pytest.fixture
+def tasks_completed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Report every Task as completed without creating done.md."""
+    monkeypatch.setattr(Task, "is_completed", property(lambda self: True))
+
+
+def _with_instruction(task: Task, **changes: Any) -> Task:
+    """Copy task with the given TaskInstruction fields changed."""
+    return replace(task, instruction=replace(task.instruction, **changes))
+
+
+def _assert_contains(container: Union[str, List[str]], *expected: str) -> None:
+    """Assert each expected string is in container, reporting all that are missing."""
+    missing = [item for item in expected if item not in container]
+    assert not missing, f"missing {missing!r} in {container!r}"
+
+
+def _project_task(task: Task, name: str, status: TaskStatus, description: Optional[str]) -> Task:
+    """Copy task under a new name, status and description for project body tests."""
+    return replace(
+        _with_instruction(task, name=name, description=description), name=name, status=status
+    )
+
+
+class TestRepositoryState:
+    """Test repository and working tree queries."""
+
+    @pytest.mark.parametrize(
+        "stdout, expected",
+        [
+            ("https://github.com/user/repo.git\n", "user/repo"),
+            ("git@github.com:user/repo.git\n", "user/repo"),
+            ("https://github.com/user/repo\n", "user/repo"),
+            ("https://gitlab.com/user/repo.git\n", None),
+        ],
+        ids=["https", "ssh", "https-without-git", "non-github"],
+    )
+    def test_get_github_repo_from_remote_url(
+        self, mock_run: Mock, monkeypatch: pytest.MonkeyPatch, stdout: str, expected: Optional[str]
+    ) -> None:
+        """Test parsing the origin remote URL."""
+        monkeypatch.delenv("GITHUB_REPOSITORY", raising=False)
+        mock_run.return_value = _result(stdout=stdout)
 
-    @patch("warifuri.core.github.subprocess.run")
-    def test_working_directory_clean(self, mock_run: Mock) -> None:
-        """Test when working directory is clean."""
-        mock_result = Mock()
-        mock_result.stdout = ""
-        mock_run.return_value = mock_result
+        assert get_github_repo() == expected
 
-        result = is_working_directory_clean()
-        assert result is True
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_working_directory_dirty(self, mock_run: Mock) -> None:
-        """Test when working directory has changes."""
-        mock_result = Mock()
-        mock_result.stdout = " M file.txt\n"
-        mock_run.return_value = mock_result
+    def test_get_github_repo_command_error(
+        self, mock_run: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test when git command fails."""
+        mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+        monkeypatch.setenv("GITHUB_REPOSITORY", "env/repo")
 
-        result = is_working_directory_clean()
-        assert result is False
+        assert get_github_repo() == "env/repo"
 
-    @patch("warifuri.core.github.subprocess.run")
-    def test_working_directory_git_error(self, mock_run: Mock) -> None:
-        """Test when git command fails."""
+    def test_get_github_repo_no_env_fallback(
+        self, mock_run: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test when git fails and no environment variable."""
         mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+        monkeypatch.delenv("GITHUB_REPOSITORY", raising=False)
+
+        assert get_github_repo() is None
+
+    @pytest.mark.parametrize(
+        "side_effect, expected",
+        [
+            ([_result(), _result(returncode=0)], True),
+            ([_result(), _result(returncode=1)], False),
+            (subprocess.CalledProcessError(1, "gh"), False),
+            (FileNotFoundError("gh command not found"), False),
+        ],
+        ids=["authenticated", "not-authenticated", "not-installed", "file-not-found"],
+    )
+    def test_check_github_cli(self, mock_run: Mock, side_effect: Any, expected: bool) -> None:
+        """Test gh --version followed by gh auth status."""
+        mock_run.side_effect = side_effect
+
+        assert check_github_cli() is expected
+
+    @pytest.mark.parametrize(
+        "side_effect, expected",
+        [
+            ([_result(stdout="")], True),
+            ([_result(stdout=" M file.txt\n")], False),
+            (subprocess.CalledProcessError(1, "git"), False),
+        ],
+        ids=["clean", "dirty", "git-error"],
+    )
+    def test_is_working_directory_clean(
+        self, mock_run: Mock, side_effect: Any, expected: bool
+    ) -> None:
+        """Test git status --porcelain output handling."""
+        mock_run.side_effect = side_effect
+
+        assert is_working_directory_clean() is expected
+
+    @pytest.mark.parametrize(
+        "side_effect, expected",
+        [
+            ([_result(stdout="feature-branch\n")], "feature-branch"),
+            (subprocess.CalledProcessError(1, "git"), None),
+        ],
+        ids=["success", "error"],
+    )
+    def test_get_current_branch(
+        self, mock_run: Mock, side_effect: Any, expected: Optional[str]
+    ) -> None:
+        """Test current branch retrieval."""
+        mock_run.side_effect = side_effect
 
-        result = is_working_directory_clean()
-        assert result is False
+        assert get_current_branch() == expected
+        mock_run.assert_called_once_with(
+            _CURRENT_BRANCH_CMD, capture_output=True, text=True, check=True
+        )
 
 
-class TestCreateBranch:
-    """Test create_branch function."""
+class TestBranchOperations:
+    """Test branch creation, commits and pushes."""
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_create_branch_success(self, mock_run: Mock) -> None:
         """Test successful branch creation."""
         # Mock branch list (empty) and checkout success
         mock_run.side_effect = [
-            Mock(stdout="", returncode=0),  # git branch --list (empty)
-            Mock(returncode=0),  # git checkout -b
+            _result(stdout="", returncode=0),  # git branch --list (empty)
+            _result(returncode=0),  # git checkout -b
         ]
 
         result = create_branch("feature-branch")
         assert result is True
 
         # Verify git commands were called
-        assert mock_run.call_count == 2
-        mock_run.assert_any_call(
-            ["git", "branch", "--list", "feature-branch"], capture_output=True, text=True
-        )
-        mock_run.assert_any_call(["git", "checkout", "-b", "feature-branch"], check=True)
+        assert mock_run.call_args_list == [
+            call(["git", "branch", "--list", "feature-branch"], capture_output=True, text=True),
+            call(["git", "checkout", "-b", "feature-branch"], check=True),
+        ]
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_create_branch_existing(self, mock_run: Mock) -> None:
         """Test switching to existing branch."""
         # Mock branch list (has output) and checkout success
         mock_run.side_effect = [
-            Mock(stdout="  feature-branch\n", returncode=0),  # git branch --list (existing)
-            Mock(returncode=0),  # git checkout
+            _result(stdout="  feature-branch\n", returncode=0),  # git branch --list (existing)
+            _result(returncode=0),  # git checkout
         ]
 
         result = create_branch("feature-branch")
         assert result is True
 
         # Verify git commands were called correctly
-        assert mock_run.call_count == 2
-        mock_run.assert_any_call(
-            ["git", "branch", "--list", "feature-branch"], capture_output=True, text=True
-        )
-        mock_run.assert_any_call(["git", "checkout", "feature-branch"], check=True)
+        assert mock_run.call_args_list == [
+            call(["git", "branch", "--list", "feature-branch"], capture_output=True, text=True),
+            call(["git", "checkout", "feature-branch"], check=True),
+        ]
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_create_branch_error(self, mock_run: Mock) -> None:
         """Test branch creation failure."""
         mock_run.side_effect = subprocess.CalledProcessError(1, "git")
@@ -230,18 +271,13 @@ class TestCreateBranch:
         result = create_branch("feature-branch")
         assert result is False
 
-
-class TestCommitChanges:
-    """Test commit_changes function."""
-
-    @patch("warifuri.core.github.subprocess.run")
     def test_commit_changes_success(self, mock_run: Mock) -> None:
         """Test successful commit."""
         # Mock successful git add, diff (has changes), and commit
         mock_run.side_effect = [
-            Mock(returncode=0),  # git add .
-            Mock(returncode=1),  # git diff --cached --exit-code (has changes)
-            Mock(returncode=0, stdout="", stderr=""),  # git commit
+            _result(returncode=0),  # git add .
+            _result(returncode=1),  # git diff --cached --exit-code (has changes)
+            _result(returncode=0, stdout="", stderr=""),  # git commit
         ]
 
         result = commit_changes("Test commit message")
@@ -260,15 +296,14 @@ class TestCommitChanges:
         # Third call: git commit
         assert calls[2][0][0] == ["git", "commit", "-m", "Test commit message"]
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_commit_changes_specific_files(self, mock_run: Mock) -> None:
         """Test commit with specific files."""
         # Mock successful git add, diff (has changes), and commit
         mock_run.side_effect = [
-            Mock(returncode=0),  # git add file1.txt
-            Mock(returncode=0),  # git add file2.txt
-            Mock(returncode=1),  # git diff --cached --exit-code (has changes)
-            Mock(returncode=0, stdout="", stderr=""),  # git commit
+            _result(returncode=0),  # git add file1.txt
+            _result(returncode=0),  # git add file2.txt
+            _result(returncode=1),  # git diff --cached --exit-code (has changes)
+            _result(returncode=0, stdout="", stderr=""),  # git commit
         ]
 
         result = commit_changes("Test commit", ["file1.txt", "file2.txt"])
@@ -279,53 +314,49 @@ class TestCommitChanges:
         assert calls[0][0][0] == ["git", "add", "file1.txt"]
         assert calls[1][0][0] == ["git", "add", "file2.txt"]
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_commit_changes_no_changes(self, mock_run: Mock) -> None:
         """Test when there are no changes to commit."""
         # Mock git add and diff (no changes)
         mock_run.side_effect = [
-            Mock(returncode=0),  # git add .
-            Mock(returncode=0),  # git diff --cached --exit-code (no changes)
+            _result(returncode=0),  # git add .
+            _result(returncode=0),  # git diff --cached --exit-code (no changes)
         ]
 
         result = commit_changes("Test commit message")
         assert result is True
         assert mock_run.call_count == 2  # Should not call commit
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_commit_changes_pre_commit_hook_modified_files(self, mock_run: Mock) -> None:
         """Test when pre-commit hooks modify files."""
         # Mock git operations including pre-commit hook scenario
         mock_run.side_effect = [
-            Mock(returncode=0),  # git add .
-            Mock(returncode=1),  # git diff --cached --exit-code (has changes)
-            Mock(returncode=1, stdout="", stderr=""),  # git commit (fails, pre-commit modified)
-            Mock(returncode=0),  # git add . (second time)
-            Mock(returncode=1),  # git diff --cached --exit-code (still has changes)
-            Mock(returncode=0),  # git commit (success)
+            _result(returncode=0),  # git add .
+            _result(returncode=1),  # git diff --cached --exit-code (has changes)
+            _result(returncode=1, stdout="", stderr=""),  # git commit (fails, pre-commit modified)
+            _result(returncode=0),  # git add . (second time)
+            _result(returncode=1),  # git diff --cached --exit-code (still has changes)
+            _result(returncode=0),  # git commit (success)
         ]
 
         result = commit_changes("Test commit message")
         assert result is True
         assert mock_run.call_count == 6
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_commit_changes_pre_commit_hook_no_changes_after(self, mock_run: Mock) -> None:
         """Test when pre-commit hooks leave no changes."""
         # Mock git operations where pre-commit leaves no changes
         mock_run.side_effect = [
-            Mock(returncode=0),  # git add .
-            Mock(returncode=1),  # git diff --cached --exit-code (has changes)
-            Mock(returncode=1, stdout="", stderr=""),  # git commit (fails, pre-commit modified)
-            Mock(returncode=0),  # git add . (second time)
-            Mock(returncode=0),  # git diff --cached --exit-code (no changes after hook)
+            _result(returncode=0),  # git add .
+            _result(returncode=1),  # git diff --cached --exit-code (has changes)
+            _result(returncode=1, stdout="", stderr=""),  # git commit (fails, pre-commit modified)
+            _result(returncode=0),  # git add . (second time)
+            _result(returncode=0),  # git diff --cached --exit-code (no changes after hook)
         ]
 
         result = commit_changes("Test commit message")
         assert result is True
         assert mock_run.call_count == 5  # Should not call final commit
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_commit_changes_add_error(self, mock_run: Mock) -> None:
         """Test commit failure during git add."""
         mock_run.side_effect = subprocess.CalledProcessError(1, "git")
@@ -333,66 +364,47 @@ class TestCommitChanges:
         result = commit_changes("Test commit message")
         assert result is False
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_commit_changes_commit_error(self, mock_run: Mock) -> None:
         """Test commit failure during git commit."""
         # First call (git add) succeeds, second call (git diff) has changes, third call (git commit) fails
         mock_run.side_effect = [
-            Mock(returncode=0),  # git add .
-            Mock(returncode=1),  # git diff --cached --exit-code (has changes)
+            _result(returncode=0),  # git add .
+            _result(returncode=1),  # git diff --cached --exit-code (has changes)
             subprocess.CalledProcessError(1, "git"),  # git commit fails
         ]
 
         result = commit_changes("Test commit message")
         assert result is False
 
+    @pytest.mark.parametrize(
+        "side_effect, expected",
+        [(None, True), (subprocess.CalledProcessError(1, "git"), False)],
+        ids=["success", "error"],
+    )
+    def test_push_branch(self, mock_run: Mock, side_effect: Any, expected: bool) -> None:
+        """Test branch push result."""
+        mock_run.side_effect = side_effect
 
-class TestPushBranch:
-    """Test push_branch function."""
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_push_branch_success(self, mock_run: Mock) -> None:
-        """Test successful branch push."""
-        mock_run.return_value = Mock()
-
-        result = push_branch("feature-branch")
-        assert result is True
-
-        mock_run.assert_called_once_with(
-            ["git", "push", "-u", "origin", "feature-branch"], check=True
-        )
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_push_branch_error(self, mock_run: Mock) -> None:
-        """Test branch push failure."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "git")
-
-        result = push_branch("feature-branch")
-        assert result is False
+        assert push_branch("feature-branch") is expected
+        mock_run.assert_called_once_with(_PUSH_CMD, check=True)
 
 
-class TestCreatePullRequest:
-    """Test create_pull_request function."""
+class TestPullRequests:
+    """Test pull request creation and merging."""
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_create_pull_request_success(self, mock_run: Mock) -> None:
         """Test successful pull request creation."""
-        mock_result = Mock()
-        mock_result.stdout = "https://github.com/user/repo/pull/123\n"
-        mock_run.return_value = mock_result
+        mock_run.return_value = _result(stdout=_PR_URL + "\n")
 
         url = create_pull_request(
             title="Test PR", body="Test body", base_branch="main", draft=False, auto_merge=False
         )
 
-        assert url == "https://github.com/user/repo/pull/123"
+        assert url == _PR_URL
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_create_pull_request_draft(self, mock_run: Mock) -> None:
         """Test creating draft pull request."""
-        mock_result = Mock()
-        mock_result.stdout = "https://github.com/user/repo/pull/123\n"
-        mock_run.return_value = mock_result
+        mock_run.return_value = _result(stdout=_PR_URL + "\n")
 
         create_pull_request(title="Test PR", body="Test body", draft=True)
 
@@ -401,22 +413,18 @@ class TestCreatePullRequest:
         assert "--draft" in args
 
     @patch("warifuri.core.github.enable_auto_merge")
-    @patch("warifuri.core.github.subprocess.run")
     def test_create_pull_request_with_auto_merge(
-        self, mock_run: Mock, mock_auto_merge: Mock
+        self, mock_auto_merge: Mock, mock_run: Mock
     ) -> None:
         """Test creating pull request with auto-merge enabled."""
-        mock_result = Mock()
-        mock_result.stdout = "https://github.com/user/repo/pull/123\n"
-        mock_run.return_value = mock_result
+        mock_run.return_value = _result(stdout=_PR_URL + "\n")
         mock_auto_merge.return_value = True
 
         url = create_pull_request(title="Test PR", body="Test body", auto_merge=True, draft=False)
 
-        assert url == "https://github.com/user/repo/pull/123"
-        mock_auto_merge.assert_called_once_with("https://github.com/user/repo/pull/123")
+        assert url == _PR_URL
+        mock_auto_merge.assert_called_once_with(_PR_URL)
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_create_pull_request_error(self, mock_run: Mock) -> None:
         """Test pull request creation failure."""
         mock_run.side_effect = subprocess.CalledProcessError(1, "gh")
@@ -424,107 +432,40 @@ class TestCreatePullRequest:
         url = create_pull_request(title="Test PR", body="Test body")
         assert url is None
 
-
-class TestEnableAutoMerge:
-    """Test enable_auto_merge function."""
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_enable_auto_merge_success(self, mock_run: Mock) -> None:
-        """Test successful auto-merge enabling."""
-        mock_run.return_value = Mock()
-
-        result = enable_auto_merge("https://github.com/user/repo/pull/123", "squash")
-        assert result is True
-
-        mock_run.assert_called_once_with(
-            ["gh", "pr", "merge", "https://github.com/user/repo/pull/123", "--auto", "--squash"],
-            check=True,
-        )
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_enable_auto_merge_error(self, mock_run: Mock) -> None:
-        """Test auto-merge enabling failure."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "gh")
-
-        result = enable_auto_merge("https://github.com/user/repo/pull/123", "squash")
-        assert result is False
-
-
-class TestMergePullRequest:
-    """Test merge_pull_request function."""
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_merge_pull_request_success(self, mock_run: Mock) -> None:
-        """Test successful pull request merge."""
-        mock_run.return_value = Mock()
-
-        result = merge_pull_request("https://github.com/user/repo/pull/123", "squash")
-        assert result is True
-
-        mock_run.assert_called_once_with(
-            [
-                "gh",
-                "pr",
-                "merge",
-                "https://github.com/user/repo/pull/123",
-                "--squash",
-                "--delete-branch",
-            ],
-            check=True,
-        )
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_merge_pull_request_merge_method(self, mock_run: Mock) -> None:
+    @pytest.mark.parametrize(
+        "side_effect, expected",
+        [(None, True), (subprocess.CalledProcessError(1, "gh"), False)],
+        ids=["success", "error"],
+    )
+    def test_enable_auto_merge(self, mock_run: Mock, side_effect: Any, expected: bool) -> None:
+        """Test auto-merge enabling result."""
+        mock_run.side_effect = side_effect
+
+        assert enable_auto_merge(_PR_URL, "squash") is expected
+        mock_run.assert_called_once_with(_AUTO_MERGE_CMD, check=True)
+
+    @pytest.mark.parametrize(
+        "side_effect, expected",
+        [(None, True), (subprocess.CalledProcessError(1, "gh"), False)],
+        ids=["success", "error"],
+    )
+    def test_merge_pull_request(self, mock_run: Mock, side_effect: Any, expected: bool) -> None:
+        """Test pull request merge result."""
+        mock_run.side_effect = side_effect
+
+        assert merge_pull_request(_PR_URL, "squash") is expected
+        mock_run.assert_called_once_with(_MERGE_CMD, check=True)
+
+    @pytest.mark.parametrize("merge_method", ["squash", "merge", "rebase"])
+    def test_merge_pull_request_merge_method(self, mock_run: Mock, merge_method: str) -> None:
         """Test pull request merge with different methods."""
-        mock_run.return_value = Mock()
-
-        # Test merge method
-        merge_pull_request("https://github.com/user/repo/pull/123", "merge")
-        args = mock_run.call_args[0][0]
-        assert "--merge" in args
-
-        # Test rebase method
-        merge_pull_request("https://github.com/user/repo/pull/123", "rebase")
-        args = mock_run.call_args[0][0]
-        assert "--rebase" in args
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_merge_pull_request_error(self, mock_run: Mock) -> None:
-        """Test pull request merge failure."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "gh")
-
-        result = merge_pull_request("https://github.com/user/repo/pull/123", "squash")
-        assert result is False
-
-
-class TestGetCurrentBranch:
-    """Test get_current_branch function."""
+        merge_pull_request(_PR_URL, merge_method)
 
-    @patch("warifuri.core.github.subprocess.run")
-    def test_get_current_branch_success(self, mock_run: Mock) -> None:
-        """Test successful current branch retrieval."""
-        mock_result = Mock()
-        mock_result.stdout = "feature-branch\n"
-        mock_run.return_value = mock_result
+        assert f"--{merge_method}" in mock_run.call_args[0][0]
 
-        branch = get_current_branch()
-        assert branch == "feature-branch"
 
-        mock_run.assert_called_once_with(
-            ["git", "branch", "--show-current"], capture_output=True, text=True, check=True
-        )
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_get_current_branch_error(self, mock_run: Mock) -> None:
-        """Test current branch retrieval failure."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "git")
-
-        branch = get_current_branch()
-        assert branch is None
-
-
-class TestEnsureLabelsExist:
-    """Test ensure_labels_exist function."""
+class TestLabels:
+    """Test label lookup and creation."""
 
     @patch("warifuri.core.github._get_existing_labels")
     def test_ensure_labels_exist_empty_list(self, mock_get_labels: Mock) -> None:
@@ -560,34 +501,22 @@ class TestEnsureLabelsExist:
 
         assert result == {"bug": True, "feature": True, "new-label": False}
         mock_get_labels.assert_called_once_with("user/repo")
-        assert mock_create.call_count == 2
-        mock_create.assert_any_call("user/repo", "feature")
-        mock_create.assert_any_call("user/repo", "new-label")
-
-
-class TestGetExistingLabels:
-    """Test _get_existing_labels function."""
+        assert mock_create.call_args_list == [
+            call("user/repo", "feature"),
+            call("user/repo", "new-label"),
+        ]
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_get_existing_labels_success(self, mock_run: Mock) -> None:
         """Test successful label retrieval."""
-        mock_result = Mock()
-        mock_result.stdout = json.dumps(
-            [{"name": "bug"}, {"name": "feature"}, {"name": "enhancement"}]
-        )
-        mock_run.return_value = mock_result
+        mock_run.return_value = _result(stdout=_LABELS_JSON)
 
         labels = _get_existing_labels("user/repo")
         assert labels == {"bug", "feature", "enhancement"}
 
         mock_run.assert_called_once_with(
-            ["gh", "label", "list", "--repo", "user/repo", "--json", "name"],
-            capture_output=True,
-            text=True,
-            check=True,
+            _LABEL_LIST_CMD, capture_output=True, text=True, check=True
         )
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_get_existing_labels_error(self, mock_run: Mock) -> None:
         """Test label retrieval failure."""
         mock_run.side_effect = subprocess.CalledProcessError(1, "gh")
@@ -595,26 +524,16 @@ class TestGetExistingLabels:
         labels = _get_existing_labels("user/repo")
         assert labels == set()
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_get_existing_labels_json_error(self, mock_run: Mock) -> None:
         """Test invalid JSON response."""
-        mock_result = Mock()
-        mock_result.stdout = "invalid json"
-        mock_run.return_value = mock_result
+        mock_run.return_value = _result(stdout="invalid json")
 
         labels = _get_existing_labels("user/repo")
         assert labels == set()
 
-
-class TestCreateLabel:
-    """Test _create_label function."""
-
-    @patch("warifuri.core.github.subprocess.run")
     def test_create_label_success(self, mock_run: Mock) -> None:
         """Test successful label creation."""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        mock_run.return_value = _result(returncode=0)
 
         result = _create_label("user/repo", "new-label")
         assert result is True
@@ -637,18 +556,13 @@ class TestCreateLabel:
             check=False,
         )
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_create_label_failure(self, mock_run: Mock) -> None:
         """Test label creation failure."""
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr.strip.return_value = "Label already exists"
-        mock_run.return_value = mock_result
+        mock_run.return_value = _result(returncode=1, stderr="Label already exists\n")
 
         result = _create_label("user/repo", "existing-label")
         assert result is False
 
-    @patch("warifuri.core.github.subprocess.run")
     def test_create_label_exception(self, mock_run: Mock) -> None:
         """Test label creation with exception."""
         mock_run.side_effect = Exception("Network error")
@@ -657,21 +571,18 @@ class TestCreateLabel:
         assert result is False
 
 
-class TestCreateIssueSafe:
-    """Test create_issue_safe function."""
+class TestIssues:
+    """Test issue creation and lookup."""
 
     @patch("warifuri.core.github.ensure_labels_exist")
     @patch("warifuri.core.github.check_issue_exists")
-    @patch("warifuri.core.github.subprocess.run")
     def test_create_issue_safe_success(
-        self, mock_run: Mock, mock_check: Mock, mock_labels: Mock
+        self, mock_check: Mock, mock_labels: Mock, mock_run: Mock
     ) -> None:
         """Test successful issue creation."""
         mock_check.return_value = False
         mock_labels.return_value = {"bug": True, "feature": True}
-        mock_result = Mock()
-        mock_result.stdout = "https://github.com/user/repo/issues/123\n"
-        mock_run.return_value = mock_result
+        mock_run.return_value = _result(stdout="https://github.com/user/repo/issues/123\n")
 
         success, url = create_issue_safe(
             title="Test Issue",
@@ -713,16 +624,13 @@ class TestCreateIssueSafe:
 
     @patch("warifuri.core.github.ensure_labels_exist")
     @patch("warifuri.core.github.check_issue_exists")
-    @patch("warifuri.core.github.subprocess.run")
     def test_create_issue_safe_partial_label_failure(
-        self, mock_run: Mock, mock_check: Mock, mock_labels: Mock
+        self, mock_check: Mock, mock_labels: Mock, mock_run: Mock
     ) -> None:
         """Test when some labels cannot be created."""
         mock_check.return_value = False
         mock_labels.return_value = {"bug": True, "missing": False}
-        mock_result = Mock()
-        mock_result.stdout = "https://github.com/user/repo/issues/123\n"
-        mock_run.return_value = mock_result
+        mock_run.return_value = _result(stdout="https://github.com/user/repo/issues/123\n")
 
         success, url = create_issue_safe(
             title="Test Issue", body="Test body", labels=["bug", "missing"], repo="user/repo"
@@ -738,9 +646,8 @@ class TestCreateIssueSafe:
 
     @patch("warifuri.core.github.ensure_labels_exist")
     @patch("warifuri.core.github.check_issue_exists")
-    @patch("warifuri.core.github.subprocess.run")
     def test_create_issue_safe_command_error(
-        self, mock_run: Mock, mock_check: Mock, mock_labels: Mock
+        self, mock_check: Mock, mock_labels: Mock, mock_run: Mock
     ) -> None:
         """Test when gh command fails."""
         mock_check.return_value = False
@@ -752,114 +659,79 @@ class TestCreateIssueSafe:
         assert success is False
         assert url is None
 
+    @pytest.mark.parametrize(
+        "title, side_effect, expected",
+        [
+            ("Test Issue", [_result(stdout=_ISSUES_JSON)], True),
+            ("Missing Issue", [_result(stdout=_ISSUES_JSON)], False),
+            ("Test Issue", [_result(stdout="[]")], False),
+            ("Test Issue", subprocess.CalledProcessError(1, "gh"), False),
+            ("Test Issue", [_result(stdout="invalid json")], False),
+        ],
+        ids=["found", "not-found", "empty-result", "command-error", "json-error"],
+    )
+    def test_check_issue_exists(
+        self, mock_run: Mock, title: str, side_effect: Any, expected: bool
+    ) -> None:
+        """Test exact-title issue lookup."""
+        mock_run.side_effect = side_effect
 
-class TestCheckIssueExists:
-    """Test check_issue_exists function."""
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_check_issue_exists_found(self, mock_run: Mock) -> None:
-        """Test when issue with exact title exists."""
-        mock_result = Mock()
-        mock_result.stdout = json.dumps([{"title": "Test Issue"}, {"title": "Another Issue"}])
-        mock_run.return_value = mock_result
-
-        exists = check_issue_exists("Test Issue", "user/repo")
-        assert exists is True
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_check_issue_exists_not_found(self, mock_run: Mock) -> None:
-        """Test when issue with title doesn't exist."""
-        mock_result = Mock()
-        mock_result.stdout = json.dumps([{"title": "Different Issue"}, {"title": "Another Issue"}])
-        mock_run.return_value = mock_result
-
-        exists = check_issue_exists("Test Issue", "user/repo")
-        assert exists is False
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_check_issue_exists_empty_result(self, mock_run: Mock) -> None:
-        """Test when no issues found."""
-        mock_result = Mock()
-        mock_result.stdout = json.dumps([])
-        mock_run.return_value = mock_result
-
-        exists = check_issue_exists("Test Issue", "user/repo")
-        assert exists is False
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_check_issue_exists_command_error(self, mock_run: Mock) -> None:
-        """Test when gh command fails."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "gh")
-
-        exists = check_issue_exists("Test Issue", "user/repo")
-        assert exists is False
+        assert check_issue_exists(title, "user/repo") is expected
 
-    @patch("warifuri.core.github.subprocess.run")
-    def test_check_issue_exists_json_error(self, mock_run: Mock) -> None:
-        """Test when JSON parsing fails."""
-        mock_result = Mock()
-        mock_result.stdout = "invalid json"
-        mock_run.return_value = mock_result
+    def test_find_parent_issue_found(self, mock_run: Mock) -> None:
+        """Test when parent issue is found."""
+        mock_run.return_value = _result(stdout=_PARENT_ISSUES_JSON)
 
-        exists = check_issue_exists("Test Issue", "user/repo")
-        assert exists is False
+        url = find_parent_issue("test-project", "user/repo")
+        assert url == "https://github.com/user/repo/issues/123"
 
+        mock_run.assert_called_once_with(
+            _PARENT_ISSUE_SEARCH_CMD, capture_output=True, text=True, check=True
+        )
 
-class TestFormatTaskIssueBody:
-    """Test format_task_issue_body function."""
+    @pytest.mark.parametrize(
+        "project, side_effect",
+        [
+            ("other-project", [_result(stdout=_PARENT_ISSUES_JSON)]),
+            ("test-project", [_result(stdout="[]")]),
+            ("test-project", subprocess.CalledProcessError(1, "gh")),
+            ("test-project", [_result(stdout="invalid json")]),
+        ],
+        ids=["not-found", "empty-result", "command-error", "json-error"],
+    )
+    def test_find_parent_issue_none(self, mock_run: Mock, project: str, side_effect: Any) -> None:
+        """Test that no parent URL is returned when none matches or gh fails."""
+        mock_run.side_effect = side_effect
 
-    def create_mock_task(
-        self,
-        name: str = "test-task",
-        project: str = "test-project",
-        description: str = "Test description",
-        task_type: TaskType = TaskType.MACHINE,
-        dependencies: list = None,
-        inputs: list = None,
-        outputs: list = None,
-        note: str = "",
-    ) -> Task:
-        """Create a mock task for testing."""
-        instruction = TaskInstruction(
-            name=name,
-            description=description,
-            dependencies=dependencies or [],
-            inputs=inputs or [],
-            outputs=outputs or [],
-            note=note,
-        )
+        assert find_parent_issue(project, "user/repo") is None
 
-        task = Task(
-            project=project,
-            name=name,
-            path=Path(f"/test/path/{project}/{name}"),
-            instruction=instruction,
-            task_type=task_type,
-            status=TaskStatus.READY,
-        )
 
-        return task
+class TestIssueBodies:
+    """Test issue body formatting and its section helpers."""
 
-    def test_format_task_issue_body_basic(self) -> None:
+    def test_format_task_issue_body_basic(self, sample_task: Task) -> None:
         """Test basic task issue body formatting."""
-        task = self.create_mock_task(
-            name="test-task", project="test-project", description="A test task description"
-        )
+        task = _with_instruction(sample_task, description="A test task description")
 
         body = format_task_issue_body(task)
 
-        assert "# Task: test-project/test-task" in body
-        assert "## Description" in body
-        assert "A test task description" in body
-        assert "**Type**: machine" in body
-        assert "**Status**: ready" in body
-        assert "**Completed**: No" in body
-        assert "warifuri run --task test-project/test-task" in body
+        _assert_contains(
+            body,
+            "# Task: test-project/test-task",
+            "## Description",
+            "A test task description",
+            "**Type**: machine",
+            "**Status**: ready",
+            "**Completed**: No",
+            "warifuri run --task test-project/test-task",
+        )
 
     @patch("warifuri.core.github.find_parent_issue")
-    def test_format_task_issue_body_with_parent_url(self, mock_find_parent: Mock) -> None:
+    def test_format_task_issue_body_with_parent_url(
+        self, mock_find_parent: Mock, sample_task: Task
+    ) -> None:
         """Test task issue body with explicit parent URL."""
-        task = self.create_mock_task()
+        task = sample_task
         parent_url = "https://github.com/user/repo/issues/123"
 
         body = format_task_issue_body(task, repo="user/repo", parent_issue_url=parent_url)
@@ -868,9 +740,11 @@ class TestFormatTaskIssueBody:
         mock_find_parent.assert_not_called()
 
     @patch("warifuri.core.github.find_parent_issue")
-    def test_format_task_issue_body_with_auto_parent(self, mock_find_parent: Mock) -> None:
+    def test_format_task_issue_body_with_auto_parent(
+        self, mock_find_parent: Mock, sample_task: Task
+    ) -> None:
         """Test task issue body with auto-discovered parent."""
-        task = self.create_mock_task(project="test-project")
+        task = sample_task
         mock_find_parent.return_value = "https://github.com/user/repo/issues/456"
 
         body = format_task_issue_body(task, repo="user/repo")
@@ -878,251 +752,138 @@ class TestFormatTaskIssueBody:
         assert "**Parent Project**: https://github.com/user/repo/issues/456" in body
         mock_find_parent.assert_called_once_with("test-project", "user/repo")
 
-    def test_format_task_issue_body_with_dependencies(self) -> None:
+    def test_format_task_issue_body_with_dependencies(self, sample_task: Task) -> None:
         """Test task issue body with dependencies."""
-        task = self.create_mock_task(dependencies=["dep1", "dep2", "dep3"])
+        task = _with_instruction(sample_task, dependencies=["dep1", "dep2", "dep3"])
 
         body = format_task_issue_body(task)
 
-        assert "## Dependencies" in body
-        assert "- [ ] dep1" in body
-        assert "- [ ] dep2" in body
-        assert "- [ ] dep3" in body
+        _assert_contains(
+            body,
+            "## Dependencies",
+            "- [ ] dep1",
+            "- [ ] dep2",
+            "- [ ] dep3",
+        )
 
-    def test_format_task_issue_body_with_files(self) -> None:
+    def test_format_task_issue_body_with_files(self, sample_task: Task) -> None:
         """Test task issue body with input and output files."""
-        task = self.create_mock_task(
-            inputs=["input1.txt", "input2.json"], outputs=["output1.txt", "result.json"]
+        task = _with_instruction(
+            sample_task,
+            inputs=["input1.txt", "input2.json"],
+            outputs=["output1.txt", "result.json"],
         )
 
         body = format_task_issue_body(task)
 
-        assert "## Input Files" in body
-        assert "- `input1.txt`" in body
-        assert "- `input2.json`" in body
-        assert "## Expected Outputs" in body
-        assert "- `output1.txt`" in body
-        assert "- `result.json`" in body
+        _assert_contains(
+            body,
+            "## Input Files",
+            "- `input1.txt`",
+            "- `input2.json`",
+            "## Expected Outputs",
+            "- `output1.txt`",
+            "- `result.json`",
+        )
 
-    def test_format_task_issue_body_with_note(self) -> None:
+    def test_format_task_issue_body_with_note(self, sample_task: Task) -> None:
         """Test task issue body with note."""
-        task = self.create_mock_task(note="This is an important note about the task.")
+        task = _with_instruction(sample_task, note="This is an important note about the task.")
 
         body = format_task_issue_body(task)
 
-        assert "## Notes" in body
-        assert "This is an important note about the task." in body
+        _assert_contains(
+            body,
+            "## Notes",
+            "This is an important note about the task.",
+        )
 
-    def test_format_task_issue_body_no_project_attribute(self) -> None:
+    def test_format_task_issue_body_no_project_attribute(self, sample_task: Task) -> None:
         """Test task issue body when task has no project attribute."""
-        task = self.create_mock_task(name="standalone-task")
-        # Remove the project attribute to simulate a task without it
+        task = replace(sample_task, name="standalone-task")
+        # Remove the project attribute (on the copy) to simulate a task without it
         delattr(task, "project")
 
         body = format_task_issue_body(task)
 
-        assert "# Task: standalone-task" in body
-        assert "warifuri run --task standalone-task" in body
-
-
-class TestFormatProjectIssueBody:
-    """Test format_project_issue_body function."""
-
-    def create_mock_project(self, name: str = "test-project", tasks: list = None) -> Project:
-        """Create a mock project for testing."""
-        if tasks is None:
-            tasks = []
-
-        # Create a simple mock project
-        project = MagicMock()
-        project.name = name
-        project.tasks = tasks
-        return project
-
-    def create_mock_task(self, name: str, status: TaskStatus, description: str = "") -> Task:
-        """Create a mock task with specified status."""
-        task = MagicMock()
-        task.name = name
-        task.status = status
-        task.instruction.description = description or "No description"
-        return task
+        _assert_contains(
+            body,
+            "# Task: standalone-task",
+            "warifuri run --task standalone-task",
+        )
 
-    def test_format_project_issue_body_basic(self) -> None:
+    def test_format_project_issue_body_basic(self, sample_task: Task) -> None:
         """Test basic project issue body formatting."""
         tasks = [
-            self.create_mock_task("task1", TaskStatus.COMPLETED, "First task"),
-            self.create_mock_task("task2", TaskStatus.READY, "Second task"),
-            self.create_mock_task("task3", TaskStatus.PENDING, "Third task"),
+            _project_task(sample_task, "task1", TaskStatus.COMPLETED, "First task"),
+            _project_task(sample_task, "task2", TaskStatus.READY, "Second task"),
+            _project_task(sample_task, "task3", TaskStatus.PENDING, "Third task"),
         ]
 
-        project = self.create_mock_project("test-project", tasks)
+        project = Project(name="test-project", path=_PROJECT_PATH, tasks=tasks)
 
         body = format_project_issue_body(project)
 
-        assert "# Project: test-project" in body
-        assert "## Overview" in body
-        assert "overall progress of the 'test-project' project" in body
-        assert "## Tasks" in body
-        assert "✅ task1: First task" in body
-        assert "🔄 task2: Second task" in body
-        assert "⏸️ task3: Third task" in body
-        assert "warifuri run --task test-project" in body
+        _assert_contains(
+            body,
+            "# Project: test-project",
+            "## Overview",
+            "overall progress of the 'test-project' project",
+            "## Tasks",
+            "✅ task1: First task",
+            "🔄 task2: Second task",
+            "⏸️ task3: Third task",
+            "warifuri run --task test-project",
+        )
 
     def test_format_project_issue_body_no_tasks(self) -> None:
         """Test project issue body with no tasks."""
-        project = self.create_mock_project("empty-project", [])
+        project = Project(name="empty-project", path=_PROJECT_PATH, tasks=[])
 
         body = format_project_issue_body(project)
 
-        assert "# Project: empty-project" in body
-        assert "## Tasks" in body
-        assert "warifuri run --task empty-project" in body
+        _assert_contains(
+            body,
+            "# Project: empty-project",
+            "## Tasks",
+            "warifuri run --task empty-project",
+        )
 
-    def test_format_project_issue_body_task_no_description(self) -> None:
+    def test_format_project_issue_body_task_no_description(self, sample_task: Task) -> None:
         """Test project issue body with task that has no description."""
-        task = self.create_mock_task("no-desc-task", TaskStatus.READY)
-        task.instruction.description = None
+        task = _project_task(sample_task, "no-desc-task", TaskStatus.READY, None)
 
-        project = self.create_mock_project("test-project", [task])
+        project = Project(name="test-project", path=_PROJECT_PATH, tasks=[task])
 
         body = format_project_issue_body(project)
 
         assert "🔄 no-desc-task: No description" in body
 
-
-class TestFindParentIssue:
-    """Test find_parent_issue function."""
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_find_parent_issue_found(self, mock_run: Mock) -> None:
-        """Test when parent issue is found."""
-        mock_result = Mock()
-        mock_result.stdout = json.dumps(
-            [{"title": "[PROJECT] test-project", "url": "https://github.com/user/repo/issues/123"}]
-        )
-        mock_run.return_value = mock_result
-
-        url = find_parent_issue("test-project", "user/repo")
-        assert url == "https://github.com/user/repo/issues/123"
-
-        mock_run.assert_called_once_with(
-            [
-                "gh",
-                "issue",
-                "list",
-                "--repo",
-                "user/repo",
-                "--search",
-                '"[PROJECT] test-project" in:title',
-                "--json",
-                "title,url",
-            ],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_find_parent_issue_not_found(self, mock_run: Mock) -> None:
-        """Test when parent issue is not found."""
-        mock_result = Mock()
-        mock_result.stdout = json.dumps(
-            [
-                {
-                    "title": "[PROJECT] different-project",
-                    "url": "https://github.com/user/repo/issues/456",
-                }
-            ]
-        )
-        mock_run.return_value = mock_result
-
-        url = find_parent_issue("test-project", "user/repo")
-        assert url is None
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_find_parent_issue_empty_result(self, mock_run: Mock) -> None:
-        """Test when no issues found."""
-        mock_result = Mock()
-        mock_result.stdout = json.dumps([])
-        mock_run.return_value = mock_result
-
-        url = find_parent_issue("test-project", "user/repo")
-        assert url is None
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_find_parent_issue_command_error(self, mock_run: Mock) -> None:
-        """Test when gh command fails."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "gh")
-
-        url = find_parent_issue("test-project", "user/repo")
-        assert url is None
-
-    @patch("warifuri.core.github.subprocess.run")
-    def test_find_parent_issue_json_error(self, mock_run: Mock) -> None:
-        """Test when JSON parsing fails."""
-        mock_result = Mock()
-        mock_result.stdout = "invalid json"
-        mock_run.return_value = mock_result
-
-        url = find_parent_issue("test-project", "user/repo")
-        assert url is None
-
-
-class TestPrivateHelperFunctions:
-    """Test private helper functions for issue body formatting."""
-
-    def create_mock_task(self, **kwargs) -> Task:
-        """Create a mock task for testing."""
-        defaults = {
-            "name": "test-task",
-            "project": "test-project",
-            "description": "Test description",
-            "task_type": TaskType.MACHINE,
-            "dependencies": [],
-            "inputs": [],
-            "outputs": [],
-            "note": "",
-        }
-        defaults.update(kwargs)
-
-        instruction = TaskInstruction(
-            name=defaults["name"],
-            description=defaults["description"],
-            dependencies=defaults["dependencies"],
-            inputs=defaults["inputs"],
-            outputs=defaults["outputs"],
-            note=defaults["note"],
-        )
-
-        task = Task(
-            project=defaults["project"],
-            name=defaults["name"],
-            path=Path(f"/test/path/{defaults['project']}/{defaults['name']}"),
-            instruction=instruction,
-            task_type=defaults["task_type"],
-            status=TaskStatus.READY,
-        )
-
-        return task
-
     @patch("warifuri.core.github.find_parent_issue")
-    def test_add_parent_issue_section_with_explicit_url(self, mock_find_parent: Mock) -> None:
+    def test_add_parent_issue_section_with_explicit_url(
+        self, mock_find_parent: Mock, sample_task: Task
+    ) -> None:
         """Test _add_parent_issue_section with explicit parent URL."""
         body_lines = []
-        task = self.create_mock_task()
+        task = sample_task
         parent_url = "https://github.com/user/repo/issues/123"
 
         _add_parent_issue_section(body_lines, task, "user/repo", parent_url)
 
-        assert f"**Parent Project**: {parent_url}" in body_lines
-        assert "" in body_lines
+        _assert_contains(
+            body_lines,
+            f"**Parent Project**: {parent_url}",
+            "",
+        )
         mock_find_parent.assert_not_called()
 
     @patch("warifuri.core.github.find_parent_issue")
-    def test_add_parent_issue_section_with_auto_discovery(self, mock_find_parent: Mock) -> None:
+    def test_add_parent_issue_section_with_auto_discovery(
+        self, mock_find_parent: Mock, sample_task: Task
+    ) -> None:
         """Test _add_parent_issue_section with auto-discovery."""
         body_lines = []
-        task = self.create_mock_task(project="test-project")
+        task = sample_task
         mock_find_parent.return_value = "https://github.com/user/repo/issues/456"
 
         _add_parent_issue_section(body_lines, task, "user/repo", "")
@@ -1130,89 +891,88 @@ class TestPrivateHelperFunctions:
         assert "**Parent Project**: https://github.com/user/repo/issues/456" in body_lines
         mock_find_parent.assert_called_once_with("test-project", "user/repo")
 
-    def test_add_task_info_section(self) -> None:
+    def test_add_task_info_section(self, sample_task: Task, tasks_completed: None) -> None:
         """Test _add_task_info_section."""
         body_lines = []
-        task = self.create_mock_task(
-            description="A detailed task description", task_type=TaskType.AI
+        task = replace(
+            _with_instruction(sample_task, description="A detailed task description"),
+            task_type=TaskType.AI,
         )
-        # Mock the is_completed property
-        with patch.object(
-            type(task), "is_completed", new_callable=lambda: property(lambda self: True)
-        ):
-            _add_task_info_section(body_lines, task)
-
-        assert "## Description" in body_lines
-        assert "A detailed task description" in body_lines
-        assert "**Type**: ai" in body_lines
-        assert "**Status**: ready" in body_lines
-        assert "**Completed**: Yes" in body_lines
-
-    def test_add_dependencies_section(self) -> None:
-        """Test _add_dependencies_section."""
-        body_lines = []
-        task = self.create_mock_task(dependencies=["dep1", "dep2"])
-
-        _add_dependencies_section(body_lines, task)
-
-        assert "## Dependencies" in body_lines
-        assert "- [ ] dep1" in body_lines
-        assert "- [ ] dep2" in body_lines
-
-    def test_add_dependencies_section_no_dependencies(self) -> None:
-        """Test _add_dependencies_section with no dependencies."""
-        body_lines = []
-        task = self.create_mock_task(dependencies=[])
-
-        _add_dependencies_section(body_lines, task)
-
-        assert "## Dependencies" not in body_lines
-
-    def test_add_files_sections(self) -> None:
-        """Test _add_files_sections."""
-        body_lines = []
-        task = self.create_mock_task(inputs=["input1.txt", "input2.json"], outputs=["output.txt"])
-
-        _add_files_sections(body_lines, task)
 
-        assert "## Input Files" in body_lines
-        assert "- `input1.txt`" in body_lines
-        assert "- `input2.json`" in body_lines
-        assert "## Expected Outputs" in body_lines
-        assert "- `output.txt`" in body_lines
-
-    def test_add_files_sections_no_files(self) -> None:
-        """Test _add_files_sections with no files."""
-        body_lines = []
-        task = self.create_mock_task(inputs=[], outputs=[])
+        _add_task_info_section(body_lines, task)
 
-        _add_files_sections(body_lines, task)
-
-        assert "## Input Files" not in body_lines
-        assert "## Expected Outputs" not in body_lines
-
-    def test_add_notes_and_execution_section(self) -> None:
-        """Test _add_notes_and_execution_section."""
-        body_lines = []
-        task = self.create_mock_task(note="Important note about the task")
-        full_name = "test-project/test-task"
-
-        _add_notes_and_execution_section(body_lines, task, full_name)
-
-        assert "## Notes" in body_lines
-        assert "Important note about the task" in body_lines
-        assert "## Execution" in body_lines
-        assert "Run with: `warifuri run --task test-project/test-task`" in body_lines
-        assert "Created by warifuri CLI" in body_lines
+        _assert_contains(
+            body_lines,
+            "## Description",
+            "A detailed task description",
+            "**Type**: ai",
+            "**Status**: ready",
+            "**Completed**: Yes",
+        )
 
-    def test_add_notes_and_execution_section_no_note(self) -> None:
-        """Test _add_notes_and_execution_section with no note."""
-        body_lines = []
-        task = self.create_mock_task(note="")
-        full_name = "test-project/test-task"
+    @pytest.mark.parametrize(
+        "helper, changes, present, absent",
+        [
+            (
+                _add_dependencies_section,
+                {"dependencies": ["dep1", "dep2"]},
+                ["## Dependencies", "- [ ] dep1", "- [ ] dep2"],
+                [],
+            ),
+            (_add_dependencies_section, {}, [], ["## Dependencies"]),
+            (
+                _add_files_sections,
+                {"inputs": ["input1.txt", "input2.json"], "outputs": ["output.txt"]},
+                [
+                    "## Input Files",
+                    "- `input1.txt`",
+                    "- `input2.json`",
+                    "## Expected Outputs",
+                    "- `output.txt`",
+                ],
+                [],
+            ),
+            (_add_files_sections, {}, [], ["## Input Files", "## Expected Outputs"]),
+            (
+                partial(_add_notes_and_execution_section, full_name="test-project/test-task"),
+                {"note": "Important note about the task"},
+                [
+                    "## Notes",
+                    "Important note about the task",
+                    "## Execution",
+                    "Run with: `warifuri run --task test-project/test-task`",
+                    "Created by warifuri CLI",
+                ],
+                [],
+            ),
+            (
+                partial(_add_notes_and_execution_section, full_name="test-project/test-task"),
+                {},
+                ["## Execution", "Run with: `warifuri run --task test-project/test-task`"],
+                ["## Notes"],
+            ),
+        ],
+        ids=[
+            "dependencies",
+            "no-dependencies",
+            "files",
+            "no-files",
+            "notes-and-execution",
+            "execution-without-note",
+        ],
+    )
+    def test_add_section(
+        self,
+        sample_task: Task,
+        helper: Callable[[List[str], Task], None],
+        changes: Dict[str, Any],
+        present: List[str],
+        absent: List[str],
+    ) -> None:
+        """Test which lines each optional section helper appends."""
+        body_lines: List[str] = []
 
-        _add_notes_and_execution_section(body_lines, task, full_name)
+        helper(body_lines, _with_instruction(sample_task, **changes))
 
-        assert "## Notes" not in body_lines
-        assert "## Execution" in body_lines
-        assert "Run with: `warifuri run --task test-project/test-task`" in body_lines
+        _assert_contains(body_lines, *present)
+        assert not [line for line in absent if line in body_lines]
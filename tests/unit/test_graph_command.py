@@ -1,120 +1,150 @@
+import os
+import platform
+import subprocess
+from dataclasses import replace
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+from unittest.mock import Mock, call
 
+import click
+import pytest
 from click.testing import CliRunner
 
-from warifuri.cli.commands.graph import graph
+from warifuri.cli.commands import graph as graph_module
+from warifuri.cli.commands.graph import _create_task_node, _open_in_browser, graph
+from warifuri.cli.context import Context
+from warifuri.core import discovery
 from warifuri.core.types import Project, Task, TaskInstruction, TaskStatus, TaskType
+from warifuri.utils import validation
 
+_BASE_TASK = Task(
+    project="test-project",
+    name="test-task",
+    path=Path("test/task"),
+    instruction=TaskInstruction(
+        name="test-task", description="Test task", dependencies=[], inputs=[], outputs=[]
+    ),
+    task_type=TaskType.HUMAN,
+    status=TaskStatus.PENDING,
+)
 
-def test_graph_command_no_projects():
-    """Test graph command when no projects are found."""
-    runner = CliRunner()
+StubDiscover = Callable[[List[Project]], None]
 
-    with runner.isolated_filesystem():
-        # Create a workspace structure
-        Path("projects").mkdir()
-        workspace_path = Path.cwd()
 
-        with (
-            patch("warifuri.core.discovery.discover_all_projects_safe") as mock_discover,
-            patch("warifuri.cli.context.Context.ensure_workspace_path") as mock_workspace,
-        ):
-            mock_discover.return_value = []
-            mock_workspace.return_value = workspace_path
+def _make_task(
+    name: str = "test-task", *, dependencies: Optional[List[str]] = None, **changes: Any
+) -> Task:
+    """Copy _BASE_TASK under a new name, with any other Task field changes."""
+    instruction = replace(_BASE_TASK.instruction, name=name, dependencies=dependencies or [])
+    return replace(_BASE_TASK, name=name, instruction=instruction, **changes)
 
-            result = runner.invoke(graph)
 
-            assert result.exit_code == 0  # Command succeeds even with no projects
-            assert "No tasks found." in result.output
+def _make_project(tasks: List[Task], name: str = "test-project") -> Project:
+    """Project holding the given tasks; only name and tasks are read by the command."""
+    return Project(name=name, path=Path("test"), tasks=tasks)
 
 
-def test_graph_command_with_projects():
-    """Test graph command with projects."""
-    runner = CliRunner()
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """CliRunner shared by the module; invoke() isolates each run's I/O."""
+    return CliRunner()
 
-    task = Task(
-        project="test-project",
-        name="test-task",
-        path=Path("test/task"),
-        instruction=TaskInstruction(
-            name="test-task", description="Test task", dependencies=[], inputs=[], outputs=[]
-        ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.PENDING,
-    )
 
-    mock_project = Mock(spec=Project)
-    mock_project.tasks = [task]
+@pytest.fixture(scope="module")
+def completed_task_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Task directory containing done.md, shared read-only by the module."""
+    task_path = tmp_path_factory.mktemp("completed-task")
+    (task_path / "done.md").write_text("Task completed")
+    return task_path
 
-    with runner.isolated_filesystem():
-        # Create a workspace structure
-        Path("projects").mkdir()
-        workspace_path = Path.cwd()
 
-        with (
-            patch("warifuri.core.discovery.discover_all_projects_safe") as mock_discover,
-            patch("warifuri.cli.context.Context.ensure_workspace_path") as mock_workspace,
-        ):
-            mock_discover.return_value = [mock_project]
-            mock_workspace.return_value = workspace_path
+@pytest.fixture
+def browser_env(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Stub subprocess.run and click.echo for _open_in_browser, with BROWSER unset."""
+    env = SimpleNamespace(run=Mock(), echo=Mock())
+    monkeypatch.setattr(subprocess, "run", env.run)
+    monkeypatch.setattr(click, "echo", env.echo)
+    monkeypatch.delenv("BROWSER", raising=False)
+    return env
 
-            result = runner.invoke(graph)
 
-            assert result.exit_code == 0
+@pytest.fixture
+def stub_discover(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> StubDiscover:
+    """Run the graph command in tmp_path and have discovery return the given projects."""
+    (tmp_path / "projects").mkdir()
+    monkeypatch.setattr(Context, "ensure_workspace_path", lambda self: tmp_path)
 
+    def _stub(projects: List[Project]) -> None:
+        monkeypatch.setattr(
+            discovery, "discover_all_projects_safe", lambda workspace_path: projects
+        )
 
-def test_graph_command_dot_format():
-    """Test graph command with DOT format output."""
-    runner = CliRunner()
+    return _stub
 
-    task = Task(
-        project="test-project",
-        name="test-task",
-        path=Path("test/task"),
-        instruction=TaskInstruction(
-            name="test-task", description="Test task", dependencies=[], inputs=[], outputs=[]
-        ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.PENDING,
-    )
 
-    mock_project = Mock(spec=Project)
-    mock_project.tasks = [task]
+@pytest.fixture
+def mock_detect(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace detect_circular_dependencies with a Mock."""
+    detect = Mock()
+    monkeypatch.setattr(validation, "detect_circular_dependencies", detect)
+    return detect
 
-    with runner.isolated_filesystem():
-        # Create a workspace structure
-        Path("projects").mkdir()
-        workspace_path = Path.cwd()
 
-        with (
-            patch("warifuri.core.discovery.discover_all_projects_safe") as mock_discover,
-            patch("warifuri.cli.context.Context.ensure_workspace_path") as mock_workspace,
-        ):
-            mock_discover.return_value = [mock_project]
-            mock_workspace.return_value = workspace_path
+def test_graph_command_no_projects(runner: CliRunner, stub_discover: StubDiscover):
+    """Test graph command when no projects are found."""
+    stub_discover([])
+
+    result = runner.invoke(graph)
 
-            result = runner.invoke(graph, ["--format", "mermaid"])
+    assert result.exit_code == 0  # Command succeeds even with no projects
+    assert "No tasks found." in result.output
 
-            assert result.exit_code == 0
-            assert "graph TD" in result.output
+
+@pytest.mark.parametrize(
+    "changes, args, expected",
+    [
+        ({}, [], "⏸️ test-project/test-task"),
+        ({}, ["--format", "mermaid"], "graph TD"),
+        ({"name": "ready-task", "status": TaskStatus.READY}, [], "🔄 test-project/ready-task"),
+        (
+            {"name": "completed-task", "status": TaskStatus.COMPLETED},
+            [],
+            "✅ test-project/completed-task",
+        ),
+        (
+            {"name": "specific-task", "project": "specific-project"},
+            ["--project", "specific-project"],
+            "specific-project/specific-task",
+        ),
+    ],
+    ids=["ascii", "mermaid", "ready", "completed", "project-filter"],
+)
+def test_graph_command_render(
+    runner: CliRunner,
+    stub_discover: StubDiscover,
+    completed_task_path: Path,
+    changes: Dict[str, Any],
+    args: List[str],
+    expected: str,
+):
+    """Test graph command output per format, task status and project filter."""
+    if changes.get("status") is TaskStatus.COMPLETED:
+        # Completion is read from done.md on disk, not from the status field
+        changes = {**changes, "path": completed_task_path}
+    task = _make_task(**changes)
+
+    stub_discover([_make_project([task], name=task.project)])
+
+    result = runner.invoke(graph, args)
+
+    assert result.exit_code == 0
+    assert expected in result.output
 
 
 def test_create_task_node():
     """Test _create_task_node function."""
-    from warifuri.cli.commands.graph import _create_task_node
-
-    task = Task(
-        project="test-project",
-        name="test-task",
-        path=Path("test/task"),
-        instruction=TaskInstruction(
-            name="test-task", description="Test task", dependencies=[], inputs=[], outputs=[]
-        ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.PENDING,
-    )
+    task = _make_task()
 
     node = _create_task_node(task)
 
@@ -122,225 +152,75 @@ def test_create_task_node():
     # The label contains project/task name, not description
 
 
-def test_graph_command_circular_dependency():
-    """Test graph command with circular dependencies."""
-    runner = CliRunner()
-
-    task1 = Task(
-        project="test-project",
-        name="task1",
-        path=Path("test/task1"),
-        instruction=TaskInstruction(
-            name="task1", description="Task 1", dependencies=["task2"], inputs=[], outputs=[]
+@pytest.mark.parametrize(
+    "detect, expected",
+    [
+        (
+            {"return_value": ["task1", "task2"]},
+            "⚠️  Warning: Circular dependency detected: task1 -> task2",
         ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.PENDING,
-    )
-
-    task2 = Task(
-        project="test-project",
-        name="task2",
-        path=Path("test/task2"),
-        instruction=TaskInstruction(
-            name="task2", description="Task 2", dependencies=["task1"], inputs=[], outputs=[]
+        (
+            {"side_effect": Exception("Detection error")},
+            "⚠️  Warning: Could not check for circular dependencies: Detection error",
         ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.PENDING,
-    )
-
-    mock_project = Mock(spec=Project)
-    mock_project.tasks = [task1, task2]
-
-    with runner.isolated_filesystem():
-        # Create a workspace structure
-        Path("projects").mkdir()
-        workspace_path = Path.cwd()
-
-        with (
-            patch("warifuri.core.discovery.discover_all_projects_safe") as mock_discover,
-            patch("warifuri.utils.validation.detect_circular_dependencies") as mock_detect,
-            patch("warifuri.cli.context.Context.ensure_workspace_path") as mock_workspace,
-        ):
-            mock_discover.return_value = [mock_project]
-            mock_detect.return_value = ["task1", "task2"]
-            mock_workspace.return_value = workspace_path
-
-            result = runner.invoke(graph)
-
-            assert result.exit_code == 0
-            assert "Warning: Circular dependency detected" in result.output
-
-
-def test_graph_command_html_format():
+    ],
+    ids=["cycle-found", "detection-error"],
+)
+def test_graph_command_circular_dependency(
+    runner: CliRunner,
+    stub_discover: StubDiscover,
+    mock_detect: Mock,
+    detect: Dict[str, Any],
+    expected: str,
+):
+    """Test graph command warns about, but survives, circular dependencies."""
+    task1 = _make_task("task1", dependencies=["task2"])
+    task2 = _make_task("task2", dependencies=["task1"])
+
+    stub_discover([_make_project([task1, task2])])
+    mock_detect.configure_mock(**detect)
+
+    result = runner.invoke(graph)
+
+    assert result.exit_code == 0
+    assert expected in result.output
+
+
+def test_graph_command_html_format(runner: CliRunner, stub_discover: StubDiscover):
     """Test graph command with HTML format output."""
-    runner = CliRunner()
-
-    task = Task(
-        project="test-project",
-        name="test-task",
-        path=Path("test/task"),
-        instruction=TaskInstruction(
-            name="test-task", description="Test task", dependencies=[], inputs=[], outputs=[]
-        ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.PENDING,
-    )
-
-    mock_project = Mock(spec=Project)
-    mock_project.tasks = [task]
+    task = _make_task()
 
-    with runner.isolated_filesystem():
-        # Create a workspace structure
-        Path("projects").mkdir()
-        workspace_path = Path.cwd()
+    project = _make_project([task])
 
-        with (
-            patch("warifuri.core.discovery.discover_all_projects_safe") as mock_discover,
-            patch("warifuri.cli.context.Context.ensure_workspace_path") as mock_workspace,
-        ):
-            mock_discover.return_value = [mock_project]
-            mock_workspace.return_value = workspace_path
+    stub_discover([project])
 
-            result = runner.invoke(graph, ["--format", "html"])
+    result = runner.invoke(graph, ["--format", "html"])
 
-            assert result.exit_code == 0
-            assert "HTML graph generated:" in result.output
+    assert result.exit_code == 0
+    assert "HTML graph generated:" in result.output
 
 
-def test_graph_command_html_format_with_browser():
+def test_graph_command_html_format_with_browser(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch, stub_discover: StubDiscover
+):
     """Test graph command with HTML format and browser opening."""
-    runner = CliRunner()
-
-    task = Task(
-        project="test-project",
-        name="test-task",
-        path=Path("test/task"),
-        instruction=TaskInstruction(
-            name="test-task", description="Test task", dependencies=[], inputs=[], outputs=[]
-        ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.PENDING,
-    )
-
-    mock_project = Mock(spec=Project)
-    mock_project.tasks = [task]
-
-    with runner.isolated_filesystem():
-        # Create a workspace structure
-        Path("projects").mkdir()
-        workspace_path = Path.cwd()
-
-        with (
-            patch("warifuri.core.discovery.discover_all_projects_safe") as mock_discover,
-            patch("warifuri.cli.commands.graph._open_in_browser") as mock_open,
-            patch("warifuri.cli.context.Context.ensure_workspace_path") as mock_workspace,
-        ):
-            mock_discover.return_value = [mock_project]
-            mock_workspace.return_value = workspace_path
-
-            result = runner.invoke(graph, ["--format", "html", "--web"])
-
-            assert result.exit_code == 0
-            assert mock_open.called
-
-
-def test_graph_command_ready_tasks():
-    """Test graph command with ready task status."""
-    runner = CliRunner()
-
-    # Create a ready task
-    ready_task = Task(
-        project="test-project",
-        name="ready-task",
-        path=Path("test/ready-task"),
-        instruction=TaskInstruction(
-            name="ready-task", description="Ready task", dependencies=[], inputs=[], outputs=[]
-        ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.READY,
-    )
-
-    mock_project = Mock(spec=Project)
-    mock_project.tasks = [ready_task]
-
-    with runner.isolated_filesystem():
-        # Create a workspace structure
-        Path("projects").mkdir()
-        workspace_path = Path.cwd()
-
-        with (
-            patch("warifuri.core.discovery.discover_all_projects_safe") as mock_discover,
-            patch("warifuri.cli.context.Context.ensure_workspace_path") as mock_workspace,
-        ):
-            mock_discover.return_value = [mock_project]
-            mock_workspace.return_value = workspace_path
-
-            result = runner.invoke(graph)
-
-            assert result.exit_code == 0
-            assert "🔄" in result.output  # Ready task icon
-
-
-def test_graph_command_completed_tasks():
-    """Test graph command with completed task status."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem():
-        # Create a workspace structure
-        Path("projects").mkdir()
-        workspace_path = Path.cwd()
-
-        task_path = Path("completed-task")
-        task_path.mkdir(parents=True, exist_ok=True)
-        # Create done.md to mark task as completed
-        (task_path / "done.md").write_text("Task completed")
-
-        # Create a completed task
-        completed_task = Task(
-            project="test-project",
-            name="completed-task",
-            path=task_path,
-            instruction=TaskInstruction(
-                name="completed-task",
-                description="Completed task",
-                dependencies=[],
-                inputs=[],
-                outputs=[],
-            ),
-            task_type=TaskType.HUMAN,
-            status=TaskStatus.COMPLETED,
-        )
+    task = _make_task()
 
-        mock_project = Mock(spec=Project)
-        mock_project.tasks = [completed_task]
+    project = _make_project([task])
 
-        with (
-            patch("warifuri.core.discovery.discover_all_projects_safe") as mock_discover,
-            patch("warifuri.cli.context.Context.ensure_workspace_path") as mock_workspace,
-        ):
-            mock_discover.return_value = [mock_project]
-            mock_workspace.return_value = workspace_path
+    mock_open = Mock()
+    monkeypatch.setattr(graph_module, "_open_in_browser", mock_open)
+    stub_discover([project])
 
-            result = runner.invoke(graph)
+    result = runner.invoke(graph, ["--format", "html", "--web"])
 
-            assert result.exit_code == 0
-            assert "✅" in result.output  # Completed task icon
+    assert result.exit_code == 0
+    assert mock_open.called
 
 
 def test_create_task_node_ready_status():
     """Test _create_task_node function with ready status."""
-    from warifuri.cli.commands.graph import _create_task_node
-
-    task = Task(
-        project="test-project",
-        name="ready-task",
-        path=Path("test/task"),
-        instruction=TaskInstruction(
-            name="ready-task", description="Ready task", dependencies=[], inputs=[], outputs=[]
-        ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.READY,
-    )
+    task = _make_task("ready-task", status=TaskStatus.READY)
 
     node = _create_task_node(task)
 
@@ -348,356 +228,77 @@ def test_create_task_node_ready_status():
     assert node["shape"] == "ellipse"
 
 
-def test_create_task_node_completed_status():
+def test_create_task_node_completed_status(completed_task_path: Path):
     """Test _create_task_node function with completed status."""
-    from warifuri.cli.commands.graph import _create_task_node
-
-    with TemporaryDirectory() as temp_dir:
-        task_path = Path(temp_dir) / "completed-task"
-        task_path.mkdir(parents=True, exist_ok=True)
-        # Create done.md to mark task as completed
-        (task_path / "done.md").write_text("Task completed")
-
-        task = Task(
-            project="test-project",
-            name="completed-task",
-            path=task_path,
-            instruction=TaskInstruction(
-                name="completed-task",
-                description="Completed task",
-                dependencies=[],
-                inputs=[],
-                outputs=[],
-            ),
-            task_type=TaskType.HUMAN,
-            status=TaskStatus.COMPLETED,
-        )
-
-        node = _create_task_node(task)
-
-        assert node["color"] == "#28a745"  # Green for completed
-        assert node["shape"] == "box"
-
-
-def test_graph_command_project_filter():
-    """Test graph command with --project filter."""
-    runner = CliRunner()
-
-    task = Task(
-        project="specific-project",
-        name="specific-task",
-        path=Path("specific/task"),
-        instruction=TaskInstruction(
-            name="specific-task",
-            description="Specific task",
-            dependencies=[],
-            inputs=[],
-            outputs=[],
-        ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.PENDING,
-    )
-
-    mock_project = Mock(spec=Project)
-    mock_project.name = "specific-project"
-    mock_project.tasks = [task]
+    task = _make_task("completed-task", path=completed_task_path, status=TaskStatus.COMPLETED)
 
-    with runner.isolated_filesystem():
-        # Create a workspace structure
-        Path("projects").mkdir()
-        workspace_path = Path.cwd()
-
-        with (
-            patch("warifuri.core.discovery.discover_all_projects_safe") as mock_discover,
-            patch("warifuri.cli.context.Context.ensure_workspace_path") as mock_workspace,
-        ):
-            mock_discover.return_value = [mock_project]
-            mock_workspace.return_value = workspace_path
-
-            result = runner.invoke(graph, ["--project", "specific-project"])
-
-            assert result.exit_code == 0
-
-
-def test_graph_command_error_in_circular_detection():
-    """Test graph command when circular dependency detection fails."""
-    runner = CliRunner()
-
-    task = Task(
-        project="test-project",
-        name="test-task",
-        path=Path("test/task"),
-        instruction=TaskInstruction(
-            name="test-task", description="Test task", dependencies=[], inputs=[], outputs=[]
-        ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.PENDING,
-    )
-
-    mock_project = Mock(spec=Project)
-    mock_project.tasks = [task]
-
-    with runner.isolated_filesystem():
-        # Create a workspace structure
-        Path("projects").mkdir()
-        workspace_path = Path.cwd()
+    node = _create_task_node(task)
 
-        with (
-            patch("warifuri.core.discovery.discover_all_projects_safe") as mock_discover,
-            patch("warifuri.utils.validation.detect_circular_dependencies") as mock_detect,
-            patch("warifuri.cli.context.Context.ensure_workspace_path") as mock_workspace,
-        ):
-            mock_discover.return_value = [mock_project]
-            mock_detect.side_effect = Exception("Detection error")
-            mock_workspace.return_value = workspace_path
+    assert node["color"] == "#28a745"  # Green for completed
+    assert node["shape"] == "box"
 
-            result = runner.invoke(graph)
 
-            # Should handle error gracefully
-            assert result.exit_code == 0
+_OPENING = call("🌐 Opening graph in web browser...")
+_NOT_OPENED = [
+    call("⚠️  Could not open browser automatically: No suitable browser command found"),
+    call("Please open manually: /tmp/test.html"),
+]
 
 
-def test_open_in_browser_windows():
+def test_open_in_browser_windows(monkeypatch: pytest.MonkeyPatch, browser_env: SimpleNamespace):
     """Test _open_in_browser on Windows."""
-    from warifuri.cli.commands.graph import _open_in_browser
-
-    with (
-        patch("os.name", "nt"),
-        patch("platform.system", return_value="Windows"),
-        patch("os.startfile", create=True) as mock_startfile,
-        patch("click.echo") as mock_echo,
-    ):
-        _open_in_browser("/tmp/test.html")
-
-        mock_startfile.assert_called_once_with("/tmp/test.html")
-        mock_echo.assert_called_with("🌐 Opening graph in web browser...")
-
-
-def test_open_in_browser_macos():
-    """Test _open_in_browser on macOS."""
-    from warifuri.cli.commands.graph import _open_in_browser
-
-    with (
-        patch("os.name", "posix"),
-        patch("subprocess.run") as mock_run,
-        patch("click.echo") as mock_echo,
-    ):
-        # Mock 'which open' returning success
-        mock_run.side_effect = [
-            Mock(returncode=0),  # which open
-            Mock(returncode=0),  # open command
-        ]
-
-        _open_in_browser("/tmp/test.html")
-
-        assert mock_run.call_count == 2
-        mock_echo.assert_called_with("🌐 Opening graph in web browser...")
-
-
-def test_open_in_browser_linux():
-    """Test _open_in_browser on Linux."""
-    from warifuri.cli.commands.graph import _open_in_browser
-
-    with (
-        patch("os.name", "posix"),
-        patch("subprocess.run") as mock_run,
-        patch("click.echo") as mock_echo,
-    ):
-        # Mock 'which open' failing, 'which xdg-open' succeeding
-        mock_run.side_effect = [
-            Mock(returncode=1),  # which open (fails)
-            Mock(returncode=0),  # which xdg-open
-            Mock(returncode=0),  # xdg-open command
-        ]
-
-        _open_in_browser("/tmp/test.html")
-
-        assert mock_run.call_count == 3
-        mock_echo.assert_called_with("🌐 Opening graph in web browser...")
-
-
-def test_open_in_browser_environment_variable():
-    """Test _open_in_browser using BROWSER environment variable."""
-    from warifuri.cli.commands.graph import _open_in_browser
-
-    with (
-        patch("os.name", "posix"),
-        patch("subprocess.run") as mock_run,
-        patch("os.environ.get", return_value="firefox"),
-        patch("click.echo") as mock_echo,
-    ):
-        # Mock both open and xdg-open not available
-        mock_run.side_effect = [
-            Mock(returncode=1),  # which open (fails)
-            Mock(returncode=1),  # which xdg-open (fails)
-            Mock(returncode=0),  # firefox command
-        ]
-
-        _open_in_browser("/tmp/test.html")
-
-        assert mock_run.call_count == 3
-        mock_echo.assert_called_with("🌐 Opening graph in web browser...")
-
-
-def test_open_in_browser_no_browser_available():
-    """Test _open_in_browser when no browser is available."""
-    from warifuri.cli.commands.graph import _open_in_browser
-
-    with (
-        patch("os.name", "posix"),
-        patch("subprocess.run") as mock_run,
-        patch("os.environ.get", return_value=None),
-        patch("click.echo") as mock_echo,
-    ):
-        # Mock all browser methods failing
-        mock_run.side_effect = [
-            Mock(returncode=1),  # which open (fails)
-            Mock(returncode=1),  # which xdg-open (fails)
-        ]
-
-        _open_in_browser("/tmp/test.html")
-
-        mock_echo.assert_any_call(
-            "⚠️  Could not open browser automatically: No suitable browser command found"
-        )
-        mock_echo.assert_any_call("Please open manually: /tmp/test.html")
-
-
-def test_open_in_browser_exception():
+    mock_startfile = Mock()
+    monkeypatch.setattr(os, "name", "nt")
+    monkeypatch.setattr(platform, "system", lambda: "Windows")
+    monkeypatch.setattr(os, "startfile", mock_startfile, raising=False)
+
+    _open_in_browser("/tmp/test.html")
+
+    mock_startfile.assert_called_once_with("/tmp/test.html")
+    assert browser_env.echo.call_args_list == [_OPENING]
+
+
+@pytest.mark.parametrize(
+    "returncodes, browser, expected_echo",
+    [
+        # which open, open
+        ([0, 0], None, [_OPENING]),
+        # which open (fails), which xdg-open, xdg-open
+        ([1, 0, 0], None, [_OPENING]),
+        # which open (fails), which xdg-open (fails), $BROWSER
+        ([1, 1, 0], "firefox", [_OPENING]),
+        # which open (fails), which xdg-open (fails), no $BROWSER
+        ([1, 1], None, _NOT_OPENED),
+    ],
+    ids=["macos", "linux", "environment-variable", "no-browser-available"],
+)
+def test_open_in_browser_posix(
+    monkeypatch: pytest.MonkeyPatch,
+    browser_env: SimpleNamespace,
+    returncodes: List[int],
+    browser: Optional[str],
+    expected_echo: List[Any],
+):
+    """Test _open_in_browser command fallbacks on POSIX systems."""
+    browser_env.run.side_effect = [SimpleNamespace(returncode=code) for code in returncodes]
+    monkeypatch.setattr(os, "name", "posix")
+    if browser is not None:
+        monkeypatch.setenv("BROWSER", browser)
+
+    _open_in_browser("/tmp/test.html")
+
+    assert browser_env.run.call_count == len(returncodes)
+    assert browser_env.echo.call_args_list == expected_echo
+
+
+def test_open_in_browser_exception(monkeypatch: pytest.MonkeyPatch, browser_env: SimpleNamespace):
     """Test _open_in_browser when an exception occurs."""
-    from warifuri.cli.commands.graph import _open_in_browser
-
-    with (
-        patch("os.name", "nt"),
-        patch("platform.system", side_effect=Exception("Platform error")),
-        patch("click.echo") as mock_echo,
-    ):
-        _open_in_browser("/tmp/test.html")
-
-        mock_echo.assert_any_call("⚠️  Could not open browser automatically: Platform error")
-        mock_echo.assert_any_call("Please open manually: /tmp/test.html")
-
-
-def test_graph_command_circular_dependency_detection():
-    """Test graph command with circular dependency detection."""
-    runner = CliRunner()
-
-    # Create tasks with circular dependencies
-    task1 = Task(
-        project="test-project",
-        name="task1",
-        path=Path("test/task1"),
-        instruction=TaskInstruction(
-            name="task1", description="Task 1", dependencies=["task2"], inputs=[], outputs=[]
-        ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.PENDING,
-    )
-
-    task2 = Task(
-        project="test-project",
-        name="task2",
-        path=Path("test/task2"),
-        instruction=TaskInstruction(
-            name="task2", description="Task 2", dependencies=["task1"], inputs=[], outputs=[]
-        ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.PENDING,
-    )
-
-    mock_project = Mock(spec=Project)
-    mock_project.tasks = [task1, task2]
-
-    with runner.isolated_filesystem():
-        # Create a workspace structure
-        Path("projects").mkdir()
-        workspace_path = Path.cwd()
-
-        with (
-            patch("warifuri.core.discovery.discover_all_projects_safe") as mock_discover,
-            patch("warifuri.utils.validation.detect_circular_dependencies") as mock_detect,
-            patch("click.echo") as mock_echo,
-            patch("warifuri.cli.context.Context.ensure_workspace_path") as mock_workspace,
-        ):
-            mock_discover.return_value = [mock_project]
-            mock_detect.side_effect = Exception("Circular dependency detected")
-            mock_workspace.return_value = workspace_path
-
-            result = runner.invoke(graph)
-
-        assert result.exit_code == 0
-        mock_echo.assert_any_call(
-            "⚠️  Warning: Could not check for circular dependencies: Circular dependency detected"
-        )
-
-
-def test_graph_command_status_filter_ready():
-    """Test graph command shows ready tasks."""
-    runner = CliRunner()
-
-    ready_task = Task(
-        project="test-project",
-        name="ready-task",
-        path=Path("test/ready-task"),
-        instruction=TaskInstruction(
-            name="ready-task", description="Ready task", dependencies=[], inputs=[], outputs=[]
-        ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.READY,
-    )
-
-    mock_project = Mock(spec=Project)
-    mock_project.tasks = [ready_task]
-
-    with runner.isolated_filesystem():
-        # Create a workspace structure
-        Path("projects").mkdir()
-        workspace_path = Path.cwd()
-
-        with (
-            patch("warifuri.core.discovery.discover_all_projects_safe") as mock_discover,
-            patch("warifuri.cli.context.Context.ensure_workspace_path") as mock_workspace,
-        ):
-            mock_discover.return_value = [mock_project]
-            mock_workspace.return_value = workspace_path
-
-            result = runner.invoke(graph)
-
-            assert result.exit_code == 0
-            assert "ready-task" in result.output
-
-
-def test_graph_command_mermaid_format():
-    """Test graph command with mermaid format."""
-    runner = CliRunner()
-
-    task = Task(
-        project="test-project",
-        name="test-task",
-        path=Path("test/task"),
-        instruction=TaskInstruction(
-            name="test-task", description="Test task", dependencies=[], inputs=[], outputs=[]
-        ),
-        task_type=TaskType.HUMAN,
-        status=TaskStatus.PENDING,
-    )
-
-    mock_project = Mock(spec=Project)
-    mock_project.tasks = [task]
-
-    with runner.isolated_filesystem():
-        # Create a workspace structure
-        Path("projects").mkdir()
-        workspace_path = Path.cwd()
-
-        with (
-            patch("warifuri.core.discovery.discover_all_projects_safe") as mock_discover,
-            patch("warifuri.cli.context.Context.ensure_workspace_path") as mock_workspace,
-        ):
-            mock_discover.return_value = [mock_project]
-            mock_workspace.return_value = workspace_path
+    monkeypatch.setattr(os, "name", "nt")
+    monkeypatch.setattr(platform, "system", Mock(side_effect=Exception("Platform error")))
 
-            result = runner.invoke(graph, ["--format", "mermaid"])
+    _open_in_browser("/tmp/test.html")
 
-            assert result.exit_code == 0
-            assert "graph TD" in result.output  # Mermaid syntax
+    assert browser_env.echo.call_args_list == [
+        call("⚠️  Could not open browser automatically: Platform error"),
+        call("Please open manually: /tmp/test.html"),
+    ]